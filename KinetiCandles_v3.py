@@ -2,14 +2,21 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
+import matplotlib
+from matplotlib.artist import Artist
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.collections import LineCollection, PolyCollection
 from matplotlib.figure import Figure
 import datetime
+import io
+import multiprocessing
 import os
-import threading
+import pickle
 import time
-from typing import Optional, List, Dict, Tuple, Union, Any
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, List, Dict, Tuple, Any, Callable
 
 # Constants for the application
 HOUR_LABELS = [f"{h}:00" for h in range(0, 24, 2)]
@@ -63,6 +70,360 @@ HIGHRES_INTERVALS = [
     ("1 minute", 60),
     ("5 minutes", 300)
 ]
+HIGHRES_INTERVAL_NAMES = tuple(name for name, _ in HIGHRES_INTERVALS)
+HOURS_STR = tuple(f"{i:02d}" for i in range(24))
+_NAME_TO_SEC = dict(HIGHRES_INTERVALS)
+_SEC_TO_NAME = {seconds: name for name, seconds in HIGHRES_INTERVALS}
+
+# Simulated activity periods for the sample data generators:
+# (first hour, floor, mean, std) of the base activity level. generate_data.py
+# keeps its own copy so it runs without the GUI; keep the two in step
+WEEKDAY_ACTIVITY_PERIODS = np.array([
+    (0, 5, 10, 5),     # Sleep
+    (6, 10, 70, 15),   # Morning activity peak
+    (9, 10, 40, 10),   # Work morning
+    (12, 10, 60, 15),  # Lunch
+    (14, 10, 35, 10),  # Work afternoon
+    (17, 10, 65, 15),  # Evening commute/exercise
+    (19, 10, 30, 10),  # Evening leisure
+    (22, 5, 15, 5),    # Wind down for sleep
+], dtype=float)
+WEEKEND_ACTIVITY_PERIODS = np.array([
+    (0, 5, 10, 5),     # Sleep longer
+    (8, 10, 40, 10),   # Morning leisure
+    (11, 10, 75, 20),  # Weekend activities
+    (15, 10, 65, 15),  # Afternoon activities
+    (19, 10, 45, 15),  # Evening leisure
+    (23, 5, 20, 10),   # Late night
+], dtype=float)
+# The periods expanded to (floor, mean, std) for each hour of the week, starting Monday 00:00
+_HOURS_OF_DAY = np.arange(24)
+WEEK_ACTIVITY_PARAMS = np.concatenate([
+    periods[np.searchsorted(periods[:, 0], _HOURS_OF_DAY, side='right') - 1, 1:]
+    for periods in [WEEKDAY_ACTIVITY_PERIODS] * 5 + [WEEKEND_ACTIVITY_PERIODS] * 2
+])
+
+# Bucket edges and report labels for the activity intensity counts
+ACTIVITY_COUNT_BINS = np.array([-np.inf, 30, 60, np.inf])
+ACTIVITY_COUNT_LABELS = ('Low activity counts (<30)', 'Moderate activity counts (30-59)',
+                         'High activity counts (60+)')
+
+# Placeholder descriptions shown by the analysis window buttons: key -> (title, message)
+ANALYSIS_MESSAGES: Dict[str, Tuple[str, str]] = {
+    'fft_day': ("Frequency Analysis",
+        "This would perform FFT analysis on the current day's data.\n\n"
+        "In a full implementation, it would show frequency components and power spectrum."),
+    'fft_window': ("Frequency Analysis",
+        "This would perform FFT analysis on the current high-resolution window.\n\n"
+        "For best results, select a 1-2 hour window with 1-second data."),
+    'sample_entropy': ("Advanced Analysis",
+        "This would calculate sample entropy for the activity data.\n\n"
+        "Sample entropy measures the complexity/regularity of time series data."),
+    'approximate_entropy': ("Advanced Analysis",
+        "This would calculate approximate entropy for the activity data.\n\n"
+        "ApEn quantifies the unpredictability of fluctuations in the data."),
+    'fractal_dimension': ("Advanced Analysis",
+        "This would calculate fractal dimension for the activity data.\n\n"
+        "Fractal dimension measures how activity patterns fill space across different time scales."),
+    'dfa': ("Advanced Analysis",
+        "This would perform DFA on the activity data.\n\n"
+        "DFA identifies long-range correlations and scaling properties in the data."),
+    'repeating_patterns': ("Advanced Analysis",
+        "This would identify repeating activity patterns.\n\n"
+        "This analysis finds recurring movement sequences across different time periods."),
+    'clustering': ("Advanced Analysis",
+        "This would cluster similar activity patterns.\n\n"
+        "Clustering groups similar movement patterns to identify common behaviors."),
+}
+
+# Both factor tables are indexed by a value in 0-59: a minute or a second
+_SIXTY = np.arange(60)
+
+# Minute-level activity factor: beginning of hour tends to be more active,
+# mid-hour dip, end of hour increase
+MINUTE_FACTOR_LUT = np.select([_SIXTY < 15, (_SIXTY >= 25) & (_SIXTY < 40), _SIXTY >= 50],
+                              [1.1, 0.9, 1.05], default=1.0).astype(np.float32)
+
+# Second-level fluctuations that make 1-second resolution data more realistic
+# and interesting to visualize
+SHORT_TERM_LUT = (1.0 + 0.05 * np.sin(_SIXTY * 0.5)
+                  + 0.03 * np.cos(_SIXTY * 0.3)).astype(np.float32)
+
+# Rows parsed per chunk when streaming a CSV without pyarrow
+CSV_CHUNK_ROWS = 1_000_000
+
+# Number of high-resolution candle sets kept for quick revisits
+CANDLE_CACHE_SIZE = 32
+
+# Delay before a burst of navigation/selection events redraws the chart
+UPDATE_DEBOUNCE_MS = 150
+
+# Number of rendered chart bitmaps kept for instant revisits
+BITMAP_CACHE_SIZE = 12
+
+# Print the chart frame rate about once a second (set KINETICANDLES_DEBUG_FPS=1)
+DEBUG_FPS = os.environ.get('KINETICANDLES_DEBUG_FPS', '') not in ('', '0')
+
+
+def _hourly_stats(hours: np.ndarray, activity: np.ndarray) -> Dict[str, np.ndarray]:
+    """Compute per-hour candle statistics in a single sorted pass.
+    
+    Matches groupby('hour').agg(['first', 'last', 'max', 'min', 'mean', 'std'])
+    for rows without missing activity values.
+    
+    Args:
+        hours: Hour key for each row (hour of day, or any integer hour index)
+        activity: Activity level for each row
+        
+    Returns:
+        Dictionary of column arrays keyed like the hourly DataFrame
+    """
+    # Drop missing readings, as pandas does, then bring each hour's rows together;
+    # rows normally arrive in time order, so only sort when they do not
+    valid = ~np.isnan(activity)
+    hours, activity = hours[valid], activity[valid]
+    if (hours[1:] < hours[:-1]).any():
+        order = np.argsort(hours, kind='stable')
+        hours, activity = hours[order], activity[order]
+
+    if len(hours) == 0:
+        empty = np.zeros(0, dtype=np.float64)
+        return {'timestamp': hours, 'first': activity, 'last': activity, 'max': activity,
+                'min': activity, 'mean': empty, 'std': empty}
+
+    # Boundaries of each run of equal hours
+    starts = np.flatnonzero(np.r_[True, hours[1:] != hours[:-1]])
+    ends = np.r_[starts[1:], len(hours)]
+    counts = ends - starts
+    
+    # Two-pass variance around each hour's mean for numerical stability
+    mean = np.add.reduceat(activity, starts, dtype=np.float64) / counts
+    deviation = activity - np.repeat(mean, counts)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        std = np.sqrt(np.add.reduceat(deviation * deviation, starts) / (counts - 1))
+    
+    return {
+        'timestamp': hours[starts],
+        'first': activity[starts],
+        'last': activity[ends - 1],
+        'max': np.maximum.reduceat(activity, starts),
+        'min': np.minimum.reduceat(activity, starts),
+        'mean': mean,
+        'std': std,
+    }
+
+
+def _candle_stats(keys: np.ndarray, activity: np.ndarray) -> Dict[str, np.ndarray]:
+    """Compute first/last/max/min candles over runs of equal keys in one pass.
+    
+    Matches groupby(keys).agg(['first', 'last', 'max', 'min', 'size']) for rows
+    without missing activity values; missing readings are dropped before counting.
+    
+    Args:
+        keys: Group key for each row (e.g. interval start in epoch seconds)
+        activity: Activity level for each row
+        
+    Returns:
+        Dictionary of column arrays keyed like the aggregated DataFrame,
+        with each group's key under 'key'
+    """
+    valid = ~np.isnan(activity)
+    if not valid.all():
+        keys, activity = keys[valid], activity[valid]
+    # Rows normally arrive in time order, so only sort when they do not
+    if len(keys) > 1 and (keys[1:] < keys[:-1]).any():
+        order = np.argsort(keys, kind='stable')
+        keys, activity = keys[order], activity[order]
+    
+    if len(keys) == 0:
+        return {'key': keys, 'first': activity, 'last': activity, 'max': activity,
+                'min': activity, 'size': np.zeros(0, dtype=np.intp)}
+    
+    # Boundaries of each run of equal keys
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    ends = np.r_[starts[1:], len(keys)]
+    
+    return {
+        'key': keys[starts],
+        'first': activity[starts],
+        'last': activity[ends - 1],
+        'max': np.maximum.reduceat(activity, starts),
+        'min': np.minimum.reduceat(activity, starts),
+        'size': ends - starts,
+    }
+
+
+@lru_cache(maxsize=128)
+def _tick_positions_labels(start_hour: int, end_hour: int,
+                           tick_minutes: int) -> Tuple[np.ndarray, Tuple[str, ...]]:
+    """Build HH:MM x-axis ticks for a time window.
+    
+    Args:
+        start_hour: Start hour of the window
+        end_hour: End hour of the window
+        tick_minutes: Minutes between ticks
+        
+    Returns:
+        Tuple of (tick positions in minutes of the day, tick labels)
+    """
+    ticks = np.arange(start_hour * 60, end_hour * 60 + 1, tick_minutes)
+    ticks.setflags(write=False)
+    labels = tuple(f"{t // 60:02d}:{t % 60:02d}" for t in ticks.tolist())
+    return ticks, labels
+
+
+@lru_cache(maxsize=2)
+def _clock_labels(with_seconds: bool) -> np.ndarray:
+    """Build a lookup table of clock strings for every minute or second of a day.
+    
+    Args:
+        with_seconds: Whether to build HH:MM:SS labels per second rather than HH:MM per minute
+        
+    Returns:
+        Read-only object array indexed by minute (or second) of the day
+    """
+    two_digits = np.char.zfill(np.arange(60).astype(str), 2)
+    labels = np.char.add(np.char.add(two_digits[:24, None], ':'), two_digits[None, :]).ravel()
+    if with_seconds:
+        labels = np.char.add(np.char.add(labels[:, None], ':'), two_digits[None, :]).ravel()
+    labels = labels.astype(object)
+    labels.setflags(write=False)
+    return labels
+
+
+def _candle_geometry(xs: np.ndarray, opens: np.ndarray, closes: np.ndarray,
+                     highs: np.ndarray, lows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Build wick segments and body outlines for a series of candles.
+    
+    Args:
+        xs: X-coordinates for the candles
+        opens: Opening values
+        closes: Closing values
+        highs: Highest values
+        lows: Lowest values
+        
+    Returns:
+        Tuple of (n, 2, 2) high-low segments and (n, 4, 2) body vertices
+    """
+    segments = np.stack([np.column_stack([xs, lows]), np.column_stack([xs, highs])], axis=1)
+    
+    width = 0.8
+    lefts = xs - width/2
+    rights = lefts + width
+    bottoms = np.minimum(opens, closes)
+    tops = np.maximum(opens, closes)
+    bodies = np.stack([np.column_stack([lefts, bottoms]), np.column_stack([rights, bottoms]),
+                       np.column_stack([rights, tops]), np.column_stack([lefts, tops])], axis=1)
+    return segments, bodies
+
+
+def _trailing_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing moving average from a cumulative sum.
+    
+    Matches rolling(window, min_periods=1).mean() on values without gaps.
+    
+    Args:
+        values: Values in plotting order
+        window: Number of values averaged at each point
+        
+    Returns:
+        Float64 array of the same length as values
+    """
+    csum = np.concatenate(([0.0], np.cumsum(values, dtype=np.float64)))
+    ends = np.arange(1, len(values) + 1)
+    starts = np.maximum(ends - window, 0)
+    return (csum[ends] - csum[starts]) / (ends - starts)
+
+
+def _render_figure(snapshot: bytes, image_format: str, file_path: str) -> bytes:
+    """Render a pickled figure to an image file.
+    
+    Runs in a worker process; the figure is a private copy, so it never races
+    redraws of the on-screen chart, and rendering does not hold the GUI's GIL.
+    
+    Args:
+        snapshot: Pickled matplotlib Figure
+        image_format: Image format for savefig (e.g. 'png')
+        file_path: Path to write the image to
+        
+    Returns:
+        Encoded image bytes
+    """
+    fig = pickle.loads(snapshot)
+    buffer = io.BytesIO()
+    # The figure already carries a tight layout, so skip bbox_inches='tight' and
+    # the extra render pass it costs
+    fig.savefig(buffer, format=image_format, dpi=300)
+    image = buffer.getvalue()
+    with open(file_path, 'wb') as f:
+        f.write(image)
+    return image
+
+
+def _downsample_candles(candle_data: pd.DataFrame, max_candles: int) -> pd.DataFrame:
+    """Merge runs of neighbouring candles so at most max_candles remain.
+    
+    Args:
+        candle_data: Candle data sorted by time_index
+        max_candles: Maximum number of candles to keep
+        
+    Returns:
+        DataFrame with time_index, first, last, max and min of each merged candle
+    """
+    # Even split into buckets, as np.array_split would produce
+    starts = np.arange(max_candles) * len(candle_data) // max_candles
+    ends = np.r_[starts[1:], len(candle_data)]
+    return pd.DataFrame({
+        'time_index': candle_data['time_index'].to_numpy()[starts],
+        'first': candle_data['first'].to_numpy()[starts],
+        'last': candle_data['last'].to_numpy()[ends - 1],
+        'max': np.maximum.reduceat(candle_data['max'].to_numpy(), starts),
+        'min': np.minimum.reduceat(candle_data['min'].to_numpy(), starts),
+    })
+
+
+def _weekly_stats(codes: np.ndarray, activity: np.ndarray) -> Dict[str, np.ndarray]:
+    """Compute per-weekday statistics from day-of-week codes.
+    
+    Matches groupby('day_of_week', observed=False).agg(['mean', 'std', 'max', 'min', 'count']),
+    with NaN statistics for weekdays that have no readings.
+    
+    Args:
+        codes: Day-of-week code (0=Monday) for each row
+        activity: Activity level for each row
+        
+    Returns:
+        Dictionary of column arrays with one entry per day of week
+    """
+    n_days = len(DAYS_OF_WEEK)
+    valid = ~np.isnan(activity)
+    codes, activity = codes[valid], activity[valid]
+    
+    maxv = np.full(n_days, np.nan)
+    minv = np.full(n_days, np.nan)
+    if len(codes) == 0:
+        return {'mean': maxv.copy(), 'std': maxv.copy(), 'max': maxv, 'min': minv,
+                'count': np.zeros(n_days, dtype=np.int64)}
+    
+    # Rows arrive in time order, so each weekday is a handful of contiguous runs;
+    # reduce each run first, then fold the runs into their weekday
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    run_codes = codes[starts]
+    run_lengths = np.diff(np.r_[starts, len(codes)])
+    counts = np.bincount(run_codes, weights=run_lengths, minlength=n_days).astype(np.int64)
+    sums = np.bincount(run_codes, weights=np.add.reduceat(activity, starts, dtype=np.float64),
+                       minlength=n_days)
+    np.fmax.at(maxv, run_codes, np.maximum.reduceat(activity, starts))
+    np.fmin.at(minv, run_codes, np.minimum.reduceat(activity, starts))
+    
+    # Two-pass variance around each weekday's mean, NaN where pandas' ddof=1 is undefined
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = sums / counts
+        deviation = activity - mean[codes]
+        std = np.sqrt(np.bincount(codes, weights=deviation * deviation, minlength=n_days) / (counts - 1))
+    std[counts < 2] = np.nan
+    
+    return {'mean': mean, 'std': std, 'max': maxv, 'min': minv, 'count': counts}
 
 
 class DataModel:
@@ -73,64 +434,248 @@ class DataModel:
         self.current_day_index: int = 0
         self.days: List[datetime.date] = []
         self.has_second_resolution: bool = False
+        # Incremented whenever new data is set, so views can tell datasets apart
+        self.data_version: int = 0
+        self._day_groups: Dict[datetime.date, pd.DataFrame] = {}
+        self._name_to_index: Dict[str, int] = {}
+        # Hourly candles of every day, aggregated up front by set_data
+        self._hourly_by_day: Dict[datetime.date, pd.DataFrame] = {}
+        # Per-day results keyed by date; data is not modified after set_data
+        self._day_analysis_cache: Dict[datetime.date, Dict[str, Any]] = {}
+        self._day_stats_cache: Dict[datetime.date, pd.Series] = {}
+        self._weekly_cache: Optional[pd.DataFrame] = None
+        self._week_analysis_cache: Optional[Dict[str, Any]] = None
+        # Recently viewed high-resolution candles keyed by (date, start, end, interval)
+        self._candle_cache: OrderedDict[Tuple, Optional[pd.DataFrame]] = OrderedDict()
         
     def load_data(self, filename: str) -> bool:
-        """Load and preprocess accelerometer data from a CSV file.
+        """Load and preprocess accelerometer data from a CSV or Parquet file.
         
         Args:
-            filename: Path to the CSV file
+            filename: Path to the CSV or Parquet file
             
         Returns:
             bool: True if data was loaded successfully, False otherwise
         """
         try:
             # Load the data
-            data = pd.read_csv(filename)
-            
-            # Check for required columns
-            required_columns = ['timestamp', 'activity_level']
-            if not all(col in data.columns for col in required_columns):
-                raise ValueError(f"The file must contain these columns: {', '.join(required_columns)}")
-            
-            # Convert timestamp to datetime
-            data['timestamp'] = pd.to_datetime(data['timestamp'])
-            
-            # Add day of week
-            data['day_of_week'] = data['timestamp'].dt.day_name()
+            data = self.read_data(filename)
             
             # Detect if data has second-level resolution
             self.detect_data_resolution(data)
             
             # Store data
-            self.data = data
-            
-            # Get unique days
-            self.days = sorted(self.data['timestamp'].dt.date.unique())
-            
-            # Reset current day
-            self.current_day_index = 0
+            self.set_data(data)
             
             return True
             
         except Exception as e:
             raise e
     
+    def read_data(self, filename: str) -> pd.DataFrame:
+        """Read accelerometer data from a CSV or Parquet file without changing the model.
+        
+        This only parses the file, so it is safe to run on a background thread.
+        
+        Args:
+            filename: Path to the CSV or Parquet file
+            
+        Returns:
+            DataFrame with parsed 'timestamp' and float32 'activity_level' columns
+        """
+        required_columns = ['timestamp', 'activity_level']
+        if filename.lower().endswith('.parquet'):
+            # Parquet columns are already typed, so there is no text to parse; the
+            # schema is checked first and only the required columns are read
+            import pyarrow.parquet as pq
+            columns = pq.read_schema(filename).names
+            if not all(col in columns for col in required_columns):
+                raise ValueError(f"The file must contain these columns: {', '.join(required_columns)}")
+            data = pd.read_parquet(filename, columns=required_columns)
+            data['activity_level'] = data['activity_level'].astype('float32')
+            return data
+        
+        # Check for required columns (header only, before parsing the whole file)
+        columns = pd.read_csv(filename, nrows=0).columns
+        if not all(col in columns for col in required_columns):
+            raise ValueError(f"The file must contain these columns: {', '.join(required_columns)}")
+        
+        # Only the required columns are kept; day_of_week is rebuilt in set_data
+        read_options = {
+            'usecols': required_columns,
+            'dtype': {'activity_level': 'float32'},
+            'parse_dates': ['timestamp']
+        }
+        try:
+            # pyarrow builds typed columns directly, so the whole file is read at once
+            data = pd.read_csv(filename, engine='pyarrow', **read_options)
+        except ImportError:
+            data = None
+
+        if data is not None:
+            if isinstance(data['timestamp'].dtype, pd.DatetimeTZDtype):
+                # pyarrow converts UTC offsets to UTC, losing each reading's local
+                # wall time; re-read the raw text with the default parser and
+                # parse it as to_datetime does
+                text = pd.read_csv(filename, usecols=['timestamp'], dtype={'timestamp': str})['timestamp']
+                data['timestamp'] = pd.to_datetime(text)
+            return data
+
+        # pyarrow is optional; the default parser streams the file in chunks so
+        # only one chunk of raw text is held alongside the typed columns
+        chunks = list(pd.read_csv(filename, chunksize=CSV_CHUNK_ROWS, **read_options))
+        if not chunks:
+            return pd.read_csv(filename, **read_options)
+        data = pd.concat(chunks, ignore_index=True)
+        if not pd.api.types.is_datetime64_any_dtype(data['timestamp']):
+            # Chunks stamped with different UTC offsets concatenate as objects
+            data['timestamp'] = pd.to_datetime(data['timestamp'])
+        return data
+    
+    def write_data(self, data: pd.DataFrame, filename: str) -> None:
+        """Write accelerometer data to a Parquet or CSV file without changing the model.
+        
+        Only the columns read_data needs are written, so the file can be loaded
+        back. This is safe to run on a background thread.
+        
+        Args:
+            data: DataFrame with 'timestamp' and 'activity_level' columns
+            filename: Path to write; a .csv extension selects CSV, anything else Parquet
+        """
+        data = data[['timestamp', 'activity_level']]
+        if filename.lower().endswith('.csv'):
+            try:
+                import pyarrow as pa
+                import pyarrow.csv as pacsv
+            except ImportError:
+                data.to_csv(filename, index=False)
+                return
+            # pyarrow's C++ writer formats the rows several times faster than
+            # to_csv; whole-second timestamps are cast so they are written
+            # without zero microseconds, as to_csv writes them
+            timestamps = data['timestamp']
+            if (timestamps == timestamps.dt.floor('s')).all():
+                data = data.assign(timestamp=timestamps.astype('datetime64[s]'))
+            with open(filename, 'wb') as f:
+                # write_csv quotes its header, so the plain header is written here
+                f.write((','.join(data.columns) + '\n').encode())
+                pacsv.write_csv(pa.Table.from_pandas(data, preserve_index=False), f,
+                                pacsv.WriteOptions(include_header=False, quoting_style='none'))
+        else:
+            # Timestamps and float32 levels are stored as binary columns, with no
+            # per-value text formatting
+            data.to_parquet(filename, compression='zstd', index=False)
+    
+    def set_data(self, data: pd.DataFrame) -> None:
+        """Store a preprocessed DataFrame and index it by day.
+        
+        Args:
+            data: DataFrame with 'timestamp' and 'activity_level' columns
+        """
+        # Rows without a usable timestamp cannot be placed on any day
+        missing = data['timestamp'].isna().to_numpy()
+        if missing.any():
+            data = data[~missing].reset_index(drop=True)
+
+        # Readings stamped with a UTC offset are placed by their local wall time,
+        # as the .dt accessors would place them
+        timestamps = data['timestamp']
+        if timestamps.dt.tz is not None:
+            timestamps = timestamps.dt.tz_localize(None)
+
+        # Derive calendar fields with integer arithmetic on epoch seconds
+        # rather than through the .dt accessor
+        epoch = timestamps.values.astype('datetime64[s]').view('int64')
+        epoch_days, day_seconds = np.divmod(epoch, 86400)
+
+        # The derived columns go on a new frame, so the caller's frame is never
+        # modified and can still be read (e.g. exported) elsewhere
+        data = data.assign(
+            timestamp=timestamps,
+            # Activity levels only need single precision; this halves aggregation bandwidth
+            activity_level=data['activity_level'].astype('float32'),
+            # Add day of week as an ordered categorical so grouping works on int8 codes
+            # (1970-01-01 was a Thursday, so Monday is code 0)
+            day_of_week=pd.Categorical.from_codes(
+                ((epoch_days + 3) % 7).astype('int8'), categories=DAYS_OF_WEEK, ordered=True
+            ),
+            # Extract time-of-day components once so window queries are plain arithmetic;
+            # each fits in a byte, which keeps scans over them cheap
+            hour=(day_seconds // 3600).astype('int8'),
+            minute=(day_seconds // 60 % 60).astype('int8'),
+            second=(day_seconds % 60).astype('int8'),
+        )
+        
+        # Lay rows out day by day, so every day is one contiguous block; the sort is
+        # stable, so rows keep their order within a day
+        if not np.all(epoch_days[1:] >= epoch_days[:-1]):
+            order = np.argsort(epoch_days, kind='stable')
+            data = data.take(order).reset_index(drop=True)
+            epoch_days = epoch_days[order]
+        
+        self.data = data
+        self.data_version += 1
+        
+        # Split the data into per-day row slices once so day lookups avoid full scans
+        starts = np.flatnonzero(np.r_[True, epoch_days[1:] != epoch_days[:-1]][:len(data)])
+        ends = np.r_[starts[1:], len(data)]
+        days = epoch_days[starts].astype('datetime64[D]').tolist()
+        self._day_groups = {day: data.iloc[start:end] for day, start, end in zip(days, starts, ends)}
+        self._hourly_by_day = self._aggregate_hours(epoch_days, data)
+        self._day_analysis_cache = {}
+        self._day_stats_cache = {}
+        self._weekly_cache = None
+        self._week_analysis_cache = None
+        self._candle_cache.clear()
+        
+        # Get unique days, and the first day for each weekday name
+        self.days = list(self._day_groups.keys())
+        self._name_to_index = {}
+        for index, day in enumerate(self.days):
+            self._name_to_index.setdefault(DAYS_OF_WEEK[day.weekday()], index)
+        
+        # Reset current day
+        self.current_day_index = 0
+    
+    def _aggregate_hours(self, epoch_days: np.ndarray, data: pd.DataFrame) -> Dict[datetime.date, pd.DataFrame]:
+        """Aggregate every hour of every day in one pass over the data.
+        
+        Args:
+            epoch_days: Day number since the epoch for each row of data
+            data: Data laid out day by day, with an 'hour' column
+            
+        Returns:
+            Dictionary mapping each day with readings to its hourly DataFrame
+        """
+        if len(data) == 0:
+            return {}
+        stats = _hourly_stats(epoch_days * 24 + data['hour'].to_numpy(),
+                              data['activity_level'].to_numpy())
+        
+        # Split the (day, hour) rows back into one frame per day
+        hour_days, hours = np.divmod(stats['timestamp'], 24)
+        stats['timestamp'] = hours.astype('int8')
+        hourly = pd.DataFrame(stats)
+        if len(hourly) == 0:
+            # Every reading was missing
+            return {}
+        starts = np.flatnonzero(np.r_[True, hour_days[1:] != hour_days[:-1]])
+        ends = np.r_[starts[1:], len(hourly)]
+        days = hour_days[starts].astype('datetime64[D]').tolist()
+        return {day: hourly.iloc[start:end].reset_index(drop=True)
+                for day, start, end in zip(days, starts, ends)}
+    
     def detect_data_resolution(self, data: pd.DataFrame) -> None:
         """Detect the resolution of the data (seconds, minutes, hours).
         
         Args:
             data: DataFrame to analyze
         """
-        # Sample a subset of data for efficiency
-        sample_size = min(1000, len(data))
-        sample = data.sample(sample_size) if len(data) > sample_size else data
-        
-        # Check if there are multiple records with the same minute but different seconds
-        sample['minute_key'] = sample['timestamp'].dt.strftime('%Y-%m-%d %H:%M')
-        records_per_minute = sample.groupby('minute_key').size()
-        
+        # Inspect the leading rows for efficiency (recordings are contiguous in time)
+        minutes = data['timestamp'].head(2000).values.astype('datetime64[m]')
+
         # If we have multiple records per minute, we likely have second-level resolution
-        self.has_second_resolution = (records_per_minute > 1).any()
+        self.has_second_resolution = bool(len(np.unique(minutes)) < len(minutes))
         
         print(f"Data resolution detection: {'Second-level' if self.has_second_resolution else 'Minute-level'} resolution")
     
@@ -146,29 +691,57 @@ class DataModel:
         if current_date is None or self.data is None:
             return None
         
-        return self.data[self.data['timestamp'].dt.date == current_date]
+        return self._day_groups.get(current_date)
     
     def get_daily_data_grouped_by_hour(self) -> Optional[pd.DataFrame]:
-        """Get hourly grouped data for the current day."""
+        """Get hourly grouped data for the current day.
+        
+        All days are aggregated by set_data, so this is a lookup.
+        """
+        return self._hourly_by_day.get(self.get_current_date())
+    
+    def get_daily_statistics(self) -> Optional[pd.Series]:
+        """Get summary statistics of activity levels for the current day."""
+        current_date = self.get_current_date()
+        if current_date in self._day_stats_cache:
+            return self._day_stats_cache[current_date]
+        
         day_data = self.get_data_for_current_day()
         if day_data is None or len(day_data) == 0:
             return None
         
-        hourly_data = day_data.groupby(day_data['timestamp'].dt.hour)['activity_level'].agg([
-            'first', 'last', 'max', 'min', 'mean', 'std'
-        ]).reset_index()
-        
-        return hourly_data
+        # Same fields as Series.describe(), from one partition for the quartiles
+        # and plain reductions for the rest
+        activity = day_data['activity_level'].to_numpy(dtype=np.float64)
+        activity = activity[~np.isnan(activity)]
+        if len(activity):
+            q1, median, q3 = np.quantile(activity, [0.25, 0.5, 0.75])
+            values = [len(activity), activity.mean(),
+                      activity.std(ddof=1) if len(activity) > 1 else np.nan,
+                      activity.min(), q1, median, q3, activity.max()]
+        else:
+            values = [0] + [np.nan] * 7
+        stats = pd.Series(values, index=['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max'],
+                          dtype=np.float64)
+        self._day_stats_cache[current_date] = stats
+        return stats
     
     def get_weekly_data(self) -> Optional[pd.DataFrame]:
         """Get data aggregated by day of week."""
         if self.data is None:
             return None
+        if self._weekly_cache is not None:
+            return self._weekly_cache
         
-        # Group by day of week
-        return self.data.groupby('day_of_week')['activity_level'].agg([
-            'mean', 'std', 'max', 'min', 'count'
-        ]).reindex(DAYS_OF_WEEK)
+        # Aggregate over the int8 day-of-week codes in a few vectorised passes
+        stats = _weekly_stats(
+            self.data['day_of_week'].cat.codes.to_numpy(),
+            self.data['activity_level'].to_numpy()
+        )
+        index = pd.CategoricalIndex(DAYS_OF_WEEK, categories=DAYS_OF_WEEK,
+                                    ordered=True, name='day_of_week')
+        self._weekly_cache = pd.DataFrame(stats, index=index)
+        return self._weekly_cache
     
     def get_high_resolution_data(self, start_hour: int, end_hour: int) -> Optional[pd.DataFrame]:
         """Get high-resolution data for a specific time window.
@@ -185,25 +758,52 @@ class DataModel:
             return None
         
         # Filter to specified time window
-        window_data = day_data[
-            (day_data['timestamp'].dt.hour >= start_hour) & 
-            (day_data['timestamp'].dt.hour < end_hour)
-        ]
+        hours = day_data['hour'].to_numpy()
+        window_data = day_data[(hours >= start_hour) & (hours < end_hour)]
         
         if len(window_data) == 0:
             return None
         
-        # Add time index for plotting (continuous value in minutes)
-        window_data = window_data.copy()
+        # Build a thin frame with a fractional time index (minutes, including seconds)
+        # for plotting, instead of copying every column of the day slice
+        return pd.DataFrame({
+            'timestamp': window_data['timestamp'].to_numpy(),
+            'activity_level': window_data['activity_level'].to_numpy(),
+            'time_index': (
+                window_data['hour'].to_numpy(dtype=np.int32) * 60 +
+                window_data['minute'].to_numpy() +
+                window_data['second'].to_numpy() / 60
+            )
+        })
+    
+    def get_window_candles(self, start_hour: int, end_hour: int,
+                           interval_seconds: int = 60) -> Optional[pd.DataFrame]:
+        """Get candles for a time window of the current day, reusing recent results.
         
-        # Create a fractional time index including seconds
-        window_data['time_index'] = (
-            window_data['timestamp'].dt.hour * 60 + 
-            window_data['timestamp'].dt.minute +
-            window_data['timestamp'].dt.second / 60
-        )
+        Args:
+            start_hour: Start hour for the window
+            end_hour: End hour for the window
+            interval_seconds: Interval for candle aggregation in seconds (default: 60)
+            
+        Returns:
+            DataFrame with candle data (empty if too sparse for candles),
+            or None if the window has no data
+        """
+        key = (self.get_current_date(), start_hour, end_hour, interval_seconds)
+        if key in self._candle_cache:
+            self._candle_cache.move_to_end(key)
+            return self._candle_cache[key]
+        
+        window_data = self.get_high_resolution_data(start_hour, end_hour)
+        if window_data is None or len(window_data) == 0:
+            candle_data = None
+        else:
+            candle_data = self.get_candle_data(window_data, interval_seconds)
         
-        return window_data
+        self._candle_cache[key] = candle_data
+        if len(self._candle_cache) > CANDLE_CACHE_SIZE:
+            self._candle_cache.popitem(last=False)
+        return candle_data
     
     def get_candle_data(self, window_data: pd.DataFrame, interval_seconds: int = 60) -> pd.DataFrame:
         """Process window data into candles for high-resolution view.
@@ -219,43 +819,40 @@ class DataModel:
             return pd.DataFrame()
             
         # Calculate epoch time and bin it by the interval
-        window_data['epoch'] = window_data['timestamp'].astype('int64') // 10**9
-        window_data['interval'] = (window_data['epoch'] // interval_seconds) * interval_seconds
-        
-        # Group by interval
-        interval_groups = window_data.groupby('interval')
-        
-        candle_data = []
-        for interval, group in interval_groups:
-            if len(group) > 1:  # Need at least 2 points to form a candle
-                # Convert interval back to datetime for display
-                interval_dt = pd.to_datetime(interval, unit='s')
-                
-                # Create unique time index for x-axis (minutes since start of day)
-                time_index = (
-                    interval_dt.hour * 60 + 
-                    interval_dt.minute +
-                    interval_dt.second / 60
-                )
-                
-                # Format time string for display
-                if interval_seconds < 60:
-                    time_str = f"{interval_dt.hour:02d}:{interval_dt.minute:02d}:{interval_dt.second:02d}"
-                else:
-                    time_str = f"{interval_dt.hour:02d}:{interval_dt.minute:02d}"
-                
-                candle_data.append({
-                    'time_index': time_index,
-                    'first': group['activity_level'].iloc[0],
-                    'last': group['activity_level'].iloc[-1],
-                    'max': group['activity_level'].max(),
-                    'min': group['activity_level'].min(),
-                    'time_str': time_str,
-                    'timestamp': interval_dt,
-                    'interval_seconds': interval_seconds
-                })
-        
-        return pd.DataFrame(candle_data)
+        epoch = window_data['timestamp'].values.astype('datetime64[s]').view('int64')
+        interval = (epoch // interval_seconds) * interval_seconds
+
+        # Aggregate all intervals in a single sorted scan
+        stats = _candle_stats(interval, window_data['activity_level'].to_numpy())
+        keep = stats['size'] > 1  # Need at least 2 points to form a candle
+        agg = {name: column[keep] for name, column in stats.items()}
+
+        if len(agg['key']) == 0:
+            return pd.DataFrame()
+
+        # Convert intervals back to datetime for display
+        interval_dt = pd.to_datetime(agg['key'], unit='s')
+
+        # Create unique time index for x-axis (minutes since start of day)
+        time_index = agg['key'] % 86400 / 60
+
+        # Format time strings for display from a per-day lookup table
+        day_seconds = agg['key'] % 86400
+        if interval_seconds < 60:
+            time_str = _clock_labels(True)[day_seconds]
+        else:
+            time_str = _clock_labels(False)[day_seconds // 60]
+
+        return pd.DataFrame({
+            'time_index': np.asarray(time_index),
+            'first': agg['first'],
+            'last': agg['last'],
+            'max': agg['max'],
+            'min': agg['min'],
+            'time_str': time_str,
+            'timestamp': interval_dt,
+            'interval_seconds': np.full(len(time_index), interval_seconds, dtype='int32')
+        })
     
     def next_day(self) -> None:
         """Move to the next day."""
@@ -271,38 +868,31 @@ class DataModel:
     
     def find_day_index_by_name(self, day_name: str) -> Optional[int]:
         """Find index of the first occurrence of a day name."""
-        if self.data is None or day_name not in DAYS_OF_WEEK:
-            return None
-            
-        day_data = self.data[self.data['day_of_week'] == day_name]
-        if len(day_data) == 0:
-            return None
-            
-        # Get the date of this day
-        selected_date = day_data['timestamp'].dt.date.iloc[0]
-        
-        try:
-            return self.days.index(selected_date)
-        except ValueError:
-            return None
+        return self._name_to_index.get(day_name)
     
     def analyze_day_patterns(self) -> Dict[str, Any]:
         """Analyze patterns for the current day."""
+        current_date = self.get_current_date()
+        if current_date in self._day_analysis_cache:
+            return self._day_analysis_cache[current_date]
+        
         hourly_data = self.get_daily_data_grouped_by_hour()
         if hourly_data is None or len(hourly_data) == 0:
             return {}
         
-        # Identify peak activity hours
-        peak_hour = hourly_data.loc[hourly_data['max'].idxmax()]['timestamp']
+        hours = hourly_data['timestamp'].to_numpy()
+        means = hourly_data['mean'].to_numpy()
         
-        # Calculate activity distribution
-        morning_hours = hourly_data[hourly_data['timestamp'].between(6, 11)]
-        midday_hours = hourly_data[hourly_data['timestamp'].between(12, 17)]
-        evening_hours = hourly_data[hourly_data['timestamp'].between(18, 23)]
+        # Identify peak activity hours
+        peak_hour = hours[np.argmax(hourly_data['max'].to_numpy())]
         
-        morning_activity = morning_hours['mean'].mean() if len(morning_hours) > 0 else 0
-        midday_activity = midday_hours['mean'].mean() if len(midday_hours) > 0 else 0
-        evening_activity = evening_hours['mean'].mean() if len(evening_hours) > 0 else 0
+        # Calculate activity distribution over night (0-5), morning (6-11), midday (12-17)
+        # and evening (18-23) hours in one binned pass
+        segments = np.searchsorted([6, 12, 18], hours, side='right')
+        counts = np.bincount(segments, minlength=4)
+        sums = np.bincount(segments, weights=means, minlength=4)
+        segment_means = np.divide(sums, counts, out=np.zeros(4), where=counts > 0)
+        morning_activity, midday_activity, evening_activity = segment_means[1:].tolist()
         
         # Identify pattern type
         if morning_activity > midday_activity and morning_activity > evening_activity:
@@ -317,7 +907,9 @@ class DataModel:
             pattern_type = "consistent"
         
         # Calculate volatility (variation in activity)
-        volatility = hourly_data['std'].mean()
+        stds = hourly_data['std'].to_numpy()
+        stds = stds[~np.isnan(stds)]
+        volatility = stds.mean() if len(stds) > 0 else np.nan
         if volatility > 20:
             volatility_desc = "High variability in activity levels throughout the day."
         elif volatility > 10:
@@ -325,7 +917,7 @@ class DataModel:
         else:
             volatility_desc = "Consistent activity levels with minimal fluctuation."
         
-        return {
+        analysis = {
             "pattern_type": pattern_type,
             "peak_hour": int(peak_hour),
             "morning_activity": morning_activity,
@@ -334,9 +926,15 @@ class DataModel:
             "volatility": volatility,
             "volatility_desc": volatility_desc
         }
+        
+        self._day_analysis_cache[current_date] = analysis
+        return analysis
     
     def analyze_week_patterns(self) -> Dict[str, Any]:
         """Analyze patterns across the week."""
+        if self._week_analysis_cache is not None:
+            return self._week_analysis_cache
+        
         weekly_data = self.get_weekly_data()
         if weekly_data is None or weekly_data.empty:
             return {}
@@ -371,7 +969,7 @@ class DataModel:
         else:
             pattern_type = "variable_weekly"
         
-        return {
+        self._week_analysis_cache = {
             "pattern_type": pattern_type,
             "most_active_day": most_active_day,
             "least_active_day": least_active_day,
@@ -379,6 +977,7 @@ class DataModel:
             "weekend_avg": weekend_avg,
             "daily_averages": daily_avg.to_dict()
         }
+        return self._week_analysis_cache
 
 
 class ChartView:
@@ -390,14 +989,117 @@ class ChartView:
         Args:
             master: Parent frame for the chart
         """
-        # Create matplotlib figure
+        # Create matplotlib figure with one persistent axes per view type; only the
+        # active one is visible, so switching views keeps the others' artists
         self.fig = Figure(figsize=(12, 6), dpi=100)
-        self.ax = self.fig.add_subplot(111)
+        self.axes = {view_type: self.fig.add_subplot(111, label=view_type, visible=False)
+                     for view_type in ("day", "week", "high_res")}
+        self._view_type = "day"
+        self.ax = self.axes[self._view_type]
+        self.ax.set_visible(True)
+        
+        # Identity of the plot each axes currently holds (None if unknown)
+        self._axes_keys: Dict[str, Optional[Tuple]] = dict.fromkeys(self.axes)
+        
+        # Reusable (wicks, bodies, K-line, legend) artists of each axes, kept until it is cleared
+        self._candle_artists: Dict[str, Optional[Tuple[Artist, ...]]] = dict.fromkeys(self.axes)
         
         # Embed matplotlib figure in tkinter
         self.canvas = FigureCanvasTkAgg(self.fig, master=master)
         self.canvas.draw()
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        
+        # View type the current tight layout was computed for
+        self._layout_view: Optional[str] = None
+        self.canvas.mpl_connect('resize_event', self._on_resize)
+        
+        # Rendered bitmaps of recently shown plots, and the plot call still owed to
+        # the figure when the canvas is showing a restored bitmap instead
+        self._bitmap_cache: OrderedDict[Tuple, Any] = OrderedDict()
+        self._pending_plot: Optional[Tuple[str, Tuple, Callable[..., None], Tuple]] = None
+        
+        # Static high-resolution background as (key, saved region)
+        self._background: Optional[Tuple[Tuple, Any]] = None
+        
+        # Arguments of the displayed high-resolution plot and the axes width it was binned for
+        self._high_res_args: Optional[Tuple] = None
+        self._high_res_width = 0
+        
+        # Frames shown since the last frame rate report; full draws are counted
+        # through draw_event and blits by _blit
+        self._fps_frames = 0
+        self._fps_since = time.perf_counter()
+        if DEBUG_FPS:
+            self.canvas.mpl_connect('draw_event', lambda event: self._count_frame())
+    
+    def plot_cached(self, view_type: str, key: Tuple, plot_method: Callable[..., None], *args) -> None:
+        """Show a plot, reusing its axes or its stored bitmap if it has been drawn before.
+        
+        If the view's axes still holds the plot, it is simply made visible again.
+        Otherwise, on a bitmap hit only the canvas pixels are restored and the
+        figure itself is rebuilt lazily by ensure_current when something needs
+        its artists.
+        
+        Args:
+            view_type: View the plot belongs to ('day', 'week', or 'high_res')
+            key: Hashable identity of the plot contents
+            plot_method: Plotting method that draws the canvas
+            *args: Arguments for plot_method
+        """
+        bitmap = self._bitmap_cache.get(key)
+        if bitmap is not None:
+            self._bitmap_cache.move_to_end(key)
+        
+        if self._axes_keys[view_type] == key:
+            # Artists are still in place; only the visible axes and layout change
+            self._pending_plot = None
+            self._show_axes(view_type)
+            self._apply_layout(view_type)
+            if bitmap is not None:
+                self.canvas.restore_region(bitmap)
+                self._blit()
+            else:
+                # Nothing is captured from this redraw, so let Tk coalesce it
+                self.canvas.draw_idle()
+            return
+        
+        if bitmap is not None:
+            self.canvas.restore_region(bitmap)
+            self._blit()
+            self._pending_plot = (view_type, key, plot_method, args)
+            return
+        
+        self._pending_plot = None
+        plot_method(*args)
+        self._axes_keys[view_type] = key
+        self._bitmap_cache[key] = self.canvas.copy_from_bbox(self.fig.bbox)
+        if len(self._bitmap_cache) > BITMAP_CACHE_SIZE:
+            self._bitmap_cache.popitem(last=False)
+    
+    def ensure_current(self) -> None:
+        """Rebuild the figure if the canvas is showing a restored bitmap."""
+        if self._pending_plot is not None:
+            view_type, key, plot_method, args = self._pending_plot
+            self._pending_plot = None
+            plot_method(*args)
+            self._axes_keys[view_type] = key
+    
+    def _show_axes(self, view_type: str) -> None:
+        """Make the axes of a view the visible, active one.
+        
+        Args:
+            view_type: Type of view ('day', 'week', or 'high_res')
+        """
+        if view_type != self._view_type:
+            self.ax.set_visible(False)
+            self._view_type = view_type
+            self.ax = self.axes[view_type]
+            self.ax.set_visible(True)
+    
+    def _clear_axes(self) -> None:
+        """Clear the active axes and forget the candle artists it held."""
+        self.ax.clear()
+        self._candle_artists[self._view_type] = None
     
     def plot_day_view(self, hourly_data: pd.DataFrame, selected_date: datetime.date) -> None:
         """Plot K-candles for a single day.
@@ -406,39 +1108,46 @@ class ChartView:
             hourly_data: Hourly aggregated data
             selected_date: Current selected date
         """
-        # Clear previous plot
-        self.ax.clear()
+        self._show_axes("day")
+        self._axes_keys["day"] = None
         
         if hourly_data is None or len(hourly_data) == 0:
+            self._clear_axes()
             self.ax.text(0.5, 0.5, "No data available for selected day", 
                          ha='center', va='center', transform=self.ax.transAxes)
             return
         
-        # Plot setup
+        # Plot setup; the hour axis never changes, so it is only set up on a fresh axes
+        if self._candle_artists["day"] is None:
+            self._clear_axes()
+            self.ax.set_xlim(-0.5, 23.5)
+            self.ax.set_xticks(range(0, 24, 2))
+            self.ax.set_xticklabels(HOUR_LABELS)
         self.ax.set_title(f"Movement Patterns: {selected_date.strftime('%A, %B %d, %Y')}")
-        self.ax.set_xlim(-0.5, 23.5)
-        self.ax.set_xticks(range(0, 24, 2))
-        self.ax.set_xticklabels(HOUR_LABELS)
-        
-        # Plot each candle
-        hours = hourly_data['timestamp']
-        for i, hour in enumerate(hours):
-            # Candle data
-            open_val = hourly_data.loc[i, 'first']
-            close_val = hourly_data.loc[i, 'last']
-            high_val = hourly_data.loc[i, 'max']
-            low_val = hourly_data.loc[i, 'min']
-            
-            self._plot_candle(hour, open_val, close_val, high_val, low_val)
         
         # Add moving average line (K-line)
+        ma_data = None
         if len(hourly_data) >= 3:  # Need at least 3 points for meaningful average
-            ma_data = hourly_data['last'].rolling(window=3, min_periods=1).mean()
-            self.ax.plot(hours, ma_data, color='purple', linewidth=2, label='K-Line (3-hour MA)')
-            self.ax.legend()
-        
-        # Finalize plot
-        self._finalize_plot()
+            ma_data = _trailing_mean(hourly_data['last'].to_numpy(), 3)
+        
+        # Plot all candles
+        hours = hourly_data['timestamp'].to_numpy()
+        opens, closes, highs, lows = hourly_data[['first', 'last', 'max', 'min']].to_numpy().T
+        candle_artists = self._show_candles(hours, opens, closes, highs, lows,
+                                            ma_data, 'K-Line (3-hour MA)')
+        candle_artists.append(self.ax.title)
+        
+        # Span at least the 0-100 activity scale, so stepping between days keeps the
+        # y-axis (and with it the stored background) unless a day falls outside it
+        low, high = min(0.0, np.nanmin(lows)), max(100.0, np.nanmax(highs))
+        margin = (high - low) * 0.05
+        self.ax.set_ylim(low - margin, high + margin)
+        
+        # Finalize plot; stepping through days only changes the candles, so the
+        # axes, ticks and grid are blitted from a stored background
+        self.ax.set_axisbelow(True)
+        self._finalize_plot("day", draw=False)
+        self._draw_over_background(("day",), candle_artists)
     
     def plot_week_view(self, weekly_data: pd.DataFrame) -> None:
         """Plot K-candles for a full week.
@@ -447,7 +1156,9 @@ class ChartView:
             weekly_data: Weekly aggregated data
         """
         # Clear previous plot
-        self.ax.clear()
+        self._show_axes("week")
+        self._axes_keys["week"] = None
+        self._clear_axes()
         
         if weekly_data is None or weekly_data.empty:
             self.ax.text(0.5, 0.5, "No weekly data available", 
@@ -460,35 +1171,23 @@ class ChartView:
         self.ax.set_xticks(range(7))
         self.ax.set_xticklabels(DAYS_OF_WEEK)
         
-        # Process data for each day of the week
-        for i, day in enumerate(DAYS_OF_WEEK):
-            if day not in weekly_data.index:
-                continue
-                
-            day_stats = weekly_data.loc[day]
-            
-            # Use mean as open, mean as close (since we don't have actual first/last)
-            # Use max/min as high/low
-            open_val = day_stats['mean']
-            close_val = day_stats['mean']
-            high_val = day_stats['max']
-            low_val = day_stats['min']
-            
-            # Since open==close, use green candles for weekdays, red for weekends
-            color = 'red' if i >= 5 else 'green'
-            
-            # Plot high-low line
-            self.ax.plot([i, i], [low_val, high_val], color='black', linewidth=1)
-            
-            # Plot candle body
-            width = 0.8
-            rect = plt.Rectangle((i - width/2, min(open_val, close_val)), 
-                                width, abs(open_val - close_val),
-                                fill=True, color=color, alpha=0.6)
-            self.ax.add_patch(rect)
+        # Collect data for each day of the week
+        positions = [i for i, day in enumerate(DAYS_OF_WEEK) if day in weekly_data.index]
+        day_stats = weekly_data.loc[[DAYS_OF_WEEK[i] for i in positions]]
+        xs = np.array(positions)
+        
+        # Use mean as open, mean as close (since we don't have actual first/last)
+        # Use max/min as high/low
+        means = day_stats['mean'].to_numpy()
+        
+        # Since open==close, use green candles for weekdays, red for weekends
+        colors = np.where(xs >= 5, 'red', 'green')
+        
+        self._plot_candles_batch(xs, means, means, day_stats['max'].to_numpy(),
+                                 day_stats['min'].to_numpy(), colors=colors)
         
         # Finalize plot
-        self._finalize_plot()
+        self._finalize_plot("week")
     
     def plot_high_resolution_view(self, candle_data: pd.DataFrame, selected_date: datetime.date, 
                                  start_hour: int, end_hour: int, interval_seconds: int = 60) -> None:
@@ -501,10 +1200,12 @@ class ChartView:
             end_hour: End hour for the window
             interval_seconds: Interval for the candles in seconds
         """
-        # Clear previous plot
-        self.ax.clear()
+        self._show_axes("high_res")
+        self._axes_keys["high_res"] = None
+        self._high_res_args = None
         
         if candle_data is None or len(candle_data) == 0:
+            self._clear_axes()
             self.ax.text(0.5, 0.5, "No data available for selected time window", 
                          ha='center', va='center', transform=self.ax.transAxes)
             return
@@ -519,7 +1220,9 @@ class ChartView:
         else:
             interval_str = f"{interval_seconds}-second"
         
-        # Plot setup
+        # Plot setup; candles, K-line and legend are reused when the axes has them
+        if self._candle_artists["high_res"] is None:
+            self._clear_axes()
         self.ax.set_title(f"High-Resolution Movement Pattern ({interval_str} candles): "
                          f"{selected_date.strftime('%A, %B %d, %Y')} "
                          f"{start_hour:02d}:00 - {end_hour:02d}:00")
@@ -539,80 +1242,260 @@ class ChartView:
         else:
             tick_minutes = 30  # 30-minute ticks
         
-        # Create tick positions and labels
-        x_ticks = [min_time + i for i in range(0, total_minutes + 1, tick_minutes)]
-        x_labels = [f"{t // 60:02d}:{t % 60:02d}" for t in x_ticks]
+        # Tick positions and labels only depend on the window, so they are cached
+        x_ticks, x_labels = _tick_positions_labels(start_hour, end_hour, tick_minutes)
         
         self.ax.set_xticks(x_ticks)
         self.ax.set_xticklabels(x_labels, rotation=45)
         self.ax.set_xlim(min_time - 2, max_time + 2)
         
-        # Plot each candle
-        for _, row in candle_data.iterrows():
-            time_idx = row['time_index']
-            open_val = row['first']
-            close_val = row['last']
-            high_val = row['max']
-            low_val = row['min']
+        # More candles than pixel columns cannot be told apart, so merge neighbours.
+        # The axes width is only final once the layout is applied, so if laying out
+        # the plot changes the number of pixel columns the candles are binned again
+        self._high_res_args = (candle_data, selected_date, start_hour, end_hour, interval_seconds)
+        width = int(self.ax.bbox.width)
+        for _ in range(2):
+            candle_artists = self._show_high_res_candles(candle_data, width)
+            self.ax.set_axisbelow(True)
+            self._finalize_plot("high_res", draw=False)
+            laid_out_width = int(self.ax.bbox.width)
+            if min(len(candle_data), laid_out_width) == min(len(candle_data), width):
+                break
+            width = laid_out_width
+        self._high_res_width = width
+        
+        # Axes, ticks and grid only depend on the window, so they are blitted from a
+        # stored background and only the candles are redrawn
+        self._draw_over_background((start_hour, end_hour), candle_artists)
+    
+    def _show_high_res_candles(self, candle_data: pd.DataFrame, width: int) -> List[Artist]:
+        """Show high-resolution candles and their K-line, merged to fit a pixel width.
+        
+        Args:
+            candle_data: Candle data at the selected interval
+            width: Number of pixel columns of the axes
             
-            self._plot_candle(time_idx, open_val, close_val, high_val, low_val)
+        Returns:
+            List of the artists that change between redraws
+        """
+        if len(candle_data) > width:
+            candle_data = _downsample_candles(candle_data, width)
         
         # Add K-line (moving average)
+        ma_data = None
+        window_size = 0
         if len(candle_data) >= 5:  # Need at least 5 points for meaningful average
             window_size = max(5, len(candle_data) // 20)  # Adaptive window size
             
-            # Sort data by time index for proper moving average
-            sorted_data = candle_data.sort_values('time_index')
-            ma_data = sorted_data['last'].rolling(window=window_size, min_periods=1).mean()
-            
-            self.ax.plot(sorted_data['time_index'], ma_data, color='purple', linewidth=2, 
-                        label=f'K-Line ({window_size}-interval MA)')
-            self.ax.legend()
+            # Candles arrive sorted by interval, so no re-sorting is needed
+            ma_data = _trailing_mean(candle_data['last'].to_numpy(), window_size)
         
-        # Finalize plot
-        self._finalize_plot()
+        # Plot all candles
+        candle_artists = self._show_candles(
+            candle_data['time_index'].to_numpy(), candle_data['first'].to_numpy(),
+            candle_data['last'].to_numpy(), candle_data['max'].to_numpy(),
+            candle_data['min'].to_numpy(), ma_data, f'K-Line ({window_size}-interval MA)'
+        )
+        candle_artists.append(self.ax.title)
+        return candle_artists
     
-    def _plot_candle(self, x: Union[int, float], open_val: float, close_val: float, 
-                    high_val: float, low_val: float) -> None:
-        """Plot a single candle.
+    def _plot_candles_batch(self, xs: np.ndarray, opens: np.ndarray, closes: np.ndarray,
+                            highs: np.ndarray, lows: np.ndarray,
+                            colors: Optional[np.ndarray] = None) -> List[Artist]:
+        """Plot a series of candles as one wick and one body collection.
         
         Args:
-            x: X-coordinate for the candle
-            open_val: Opening value
-            close_val: Closing value
-            high_val: Highest value
-            low_val: Lowest value
+            xs: X-coordinates for the candles
+            opens: Opening values
+            closes: Closing values
+            highs: Highest values
+            lows: Lowest values
+            colors: Optional body colors (default: green for rising, red for falling)
+            
+        Returns:
+            List of the collections that were added
         """
-        # Determine color based on open vs close
-        color = 'green' if close_val >= open_val else 'red'
+        # Determine colors based on open vs close
+        if colors is None:
+            colors = np.where(closes >= opens, 'green', 'red')
         
-        # Plot high-low line
-        self.ax.plot([x, x], [low_val, high_val], color='black', linewidth=1)
+        segments, bodies = _candle_geometry(xs, opens, closes, highs, lows)
         
-        # Plot candle body
-        width = 0.8
-        rect = plt.Rectangle((x - width/2, min(open_val, close_val)), 
-                            width, abs(open_val - close_val),
-                            fill=True, color=color, alpha=0.6)
-        self.ax.add_patch(rect)
+        # Plot high-low lines
+        artists: List[Artist] = [
+            self.ax.add_collection(LineCollection(segments, colors='black', linewidths=1))
+        ]
+        
+        # Plot all candle bodies as one collection; a zero-height (doji) body has no
+        # fill and is drawn as its flat outline
+        artists.append(self.ax.add_collection(PolyCollection(bodies, facecolors=colors, edgecolors=colors,
+                                                             linewidths=1, alpha=0.6)))
+        
+        self.ax.autoscale_view()
+        return artists
     
-    def _finalize_plot(self) -> None:
-        """Add common elements and finalize the plot."""
+    def _show_candles(self, xs: np.ndarray, opens: np.ndarray, closes: np.ndarray,
+                      highs: np.ndarray, lows: np.ndarray, ma_data: Optional[np.ndarray],
+                      ma_label: str) -> List[Artist]:
+        """Show candles and their K-line on the active axes, reusing its artists.
+        
+        The first call on a cleared axes creates the wick and body collections, the
+        K-line and its legend; later calls only replace their data and colors.
+        
+        Args:
+            xs: X-coordinates for the candles
+            opens: Opening values
+            closes: Closing values
+            highs: Highest values
+            lows: Lowest values
+            ma_data: K-line values at xs, or None to hide the K-line
+            ma_label: Legend label for the K-line
+            
+        Returns:
+            List of the artists that are shown
+        """
+        artists = self._candle_artists[self._view_type]
+        if artists is None:
+            wicks, bodies = self._plot_candles_batch(xs, opens, closes, highs, lows)
+            kline, = self.ax.plot(xs, closes if ma_data is None else ma_data,
+                                  color='purple', linewidth=2, label=ma_label)
+            legend = self.ax.legend()
+            self._candle_artists[self._view_type] = (wicks, bodies, kline, legend)
+        else:
+            wicks, bodies, kline, legend = artists
+            colors = np.where(closes >= opens, 'green', 'red')
+            segments, verts = _candle_geometry(xs, opens, closes, highs, lows)
+            wicks.set_segments(segments)
+            bodies.set_verts(verts)
+            bodies.set_facecolor(colors)
+            bodies.set_edgecolor(colors)
+            if ma_data is not None:
+                kline.set_data(xs, ma_data)
+                kline.set_label(ma_label)
+                legend.get_texts()[0].set_text(ma_label)
+            
+            # Collections are not covered by relim, so rebuild the data limits from
+            # the new geometry before autoscaling
+            self.ax.ignore_existing_data_limits = True
+            self.ax.update_datalim(segments.reshape(-1, 2))
+            self.ax.update_datalim(verts.reshape(-1, 2))
+            if ma_data is not None:
+                self.ax.update_datalim(np.column_stack([xs, ma_data]))
+            self.ax.autoscale_view()
+        
+        kline.set_visible(ma_data is not None)
+        legend.set_visible(ma_data is not None)
+        return [wicks, bodies, kline, legend] if ma_data is not None else [wicks, bodies]
+    
+    def _finalize_plot(self, view_type: str, draw: bool = True) -> None:
+        """Add common elements and finalize the plot.
+        
+        Args:
+            view_type: Type of view that was plotted ('day', 'week', or 'high_res')
+            draw: Whether to redraw the canvas (default: True)
+        """
         # Add grid and labels
         self.ax.grid(True, linestyle='--', alpha=0.7)
         self.ax.set_xlabel('Time')
         self.ax.set_ylabel('Activity Level')
         
+        self._apply_layout(view_type)
+        
         # Refresh canvas
-        self.fig.tight_layout()
-        self.canvas.draw()
+        if draw:
+            self.canvas.draw()
+    
+    def _apply_layout(self, view_type: str) -> None:
+        """Recompute the tight layout if it was computed for another view.
+        
+        Args:
+            view_type: Type of view being shown ('day', 'week', or 'high_res')
+        """
+        # Only recompute the layout when the view type (tick style) or canvas size changed
+        if self._layout_view != view_type:
+            # tight_layout measures from the current margins, so start from the
+            # defaults; the layout then does not depend on the views shown before
+            self.fig.subplots_adjust(**{param: matplotlib.rcParams[f'figure.subplot.{param}']
+                                        for param in ('left', 'bottom', 'right', 'top')})
+            self.fig.tight_layout()
+            self._layout_view = view_type
+    
+    def _draw_over_background(self, background_key: Tuple, artists: List[Artist]) -> None:
+        """Draw artists over a stored static background instead of redrawing everything.
+        
+        The background (everything except the given artists) is re-rendered only when
+        its key, the canvas size, the axes position or the y-limits change.
+        
+        Args:
+            background_key: Hashable identity of the static parts of the plot
+            artists: Artists that change between redraws
+        """
+        key = (background_key, self.canvas.get_width_height(),
+               tuple(self.ax.get_position().bounds), tuple(self.ax.get_ylim()))
+        
+        if self._background is None or self._background[0] != key:
+            # A hidden title is measured as zero-size by Axes.draw and pushed upwards,
+            # so the title is blanked for the background instead of hidden
+            hidden = [artist for artist in artists if artist is not self.ax.title]
+            title = self.ax.title.get_text()
+            if len(hidden) < len(artists):
+                self.ax.title.set_text('')
+            for artist in hidden:
+                artist.set_visible(False)
+            self.canvas.draw()
+            self._background = (key, self.canvas.copy_from_bbox(self.fig.bbox))
+            for artist in hidden:
+                artist.set_visible(True)
+            self.ax.title.set_text(title)
+        else:
+            self.canvas.restore_region(self._background[1])
+        
+        # Same stacking as a full draw, which renders artists in zorder
+        for artist in sorted(artists, key=lambda artist: artist.get_zorder()):
+            self.ax.draw_artist(artist)
+        self._blit()
+    
+    def _blit(self) -> None:
+        """Show the rendered figure on the Tk canvas without a full redraw."""
+        self.canvas.blit(self.fig.bbox)
+        if DEBUG_FPS:
+            self._count_frame()
+    
+    def _count_frame(self) -> None:
+        """Count a shown frame and print the frame rate once a second has passed."""
+        self._fps_frames += 1
+        elapsed = time.perf_counter() - self._fps_since
+        if elapsed >= 1.0:
+            print(f"Chart: {self._fps_frames / elapsed:.1f} fps ({self._fps_frames} frames in {elapsed:.1f}s)")
+            self._fps_frames = 0
+            self._fps_since += elapsed
+    
+    def _on_resize(self, event) -> None:
+        """Recompute the layout of the displayed view for the new canvas size."""
+        # Stored bitmaps no longer match the canvas size, and the layout is redone
+        # first so the re-binning below sees the new axes width
+        self._bitmap_cache.clear()
+        self._layout_view = None
+        self._apply_layout(self._view_type)
+        if self._pending_plot is not None:
+            self.ensure_current()
+        elif self._high_res_args is not None and self._view_type == "high_res":
+            # Re-bin downsampled candles when the number of pixel columns changes
+            candle_count = len(self._high_res_args[0])
+            width = int(self.ax.bbox.width)
+            if min(candle_count, width) != min(candle_count, self._high_res_width):
+                self.plot_high_resolution_view(*self._high_res_args)
     
     def clear(self) -> None:
         """Clear the chart."""
-        self.ax.clear()
+        self._pending_plot = None
+        self._axes_keys[self._view_type] = None
+        if self._view_type == "high_res":
+            self._high_res_args = None
+        self._clear_axes()
         self.ax.text(0.5, 0.5, "No data loaded", 
                     ha='center', va='center', transform=self.ax.transAxes)
-        self.canvas.draw()
+        self.canvas.draw_idle()
 
 
 class AnalysisView:
@@ -629,6 +1512,7 @@ class AnalysisView:
         self.text.pack(fill=tk.BOTH, expand=True)
         self.text.insert(tk.END, "Load data to see movement pattern analysis...")
         self.text.config(state=tk.DISABLED)
+        self._shown_text: Optional[str] = None
     
     def update_day_analysis(self, analysis: Dict[str, Any]) -> None:
         """Update the analysis text with day analysis results.
@@ -639,9 +1523,6 @@ class AnalysisView:
         if not analysis:
             self.clear()
             return
-            
-        self.text.config(state=tk.NORMAL)
-        self.text.delete(1.0, tk.END)
         
         pattern_type = analysis["pattern_type"]
         peak_hour = analysis["peak_hour"]
@@ -651,14 +1532,14 @@ class AnalysisView:
         volatility = analysis["volatility"]
         volatility_desc = analysis["volatility_desc"]
         
-        self.text.insert(tk.END, f"Pattern Type: {PATTERN_TYPES[pattern_type]['name']}\n\n")
-        self.text.insert(tk.END, f"{PATTERN_TYPES[pattern_type]['description']}\n\n")
-        self.text.insert(tk.END, f"Peak Activity Hour: {peak_hour}:00\n")
-        self.text.insert(tk.END, f"Activity Distribution: Morning ({morning_activity:.1f}) | ")
-        self.text.insert(tk.END, f"Midday ({midday_activity:.1f}) | Evening ({evening_activity:.1f})\n\n")
-        self.text.insert(tk.END, f"Volatility: {volatility:.1f} - {volatility_desc}")
-        
-        self.text.config(state=tk.DISABLED)
+        self._show_text(
+            f"Pattern Type: {PATTERN_TYPES[pattern_type]['name']}\n\n"
+            f"{PATTERN_TYPES[pattern_type]['description']}\n\n"
+            f"Peak Activity Hour: {peak_hour}:00\n"
+            f"Activity Distribution: Morning ({morning_activity:.1f}) | "
+            f"Midday ({midday_activity:.1f}) | Evening ({evening_activity:.1f})\n\n"
+            f"Volatility: {volatility:.1f} - {volatility_desc}"
+        )
     
     def update_week_analysis(self, analysis: Dict[str, Any]) -> None:
         """Update the analysis text with week analysis results.
@@ -669,9 +1550,6 @@ class AnalysisView:
         if not analysis:
             self.clear()
             return
-            
-        self.text.config(state=tk.NORMAL)
-        self.text.delete(1.0, tk.END)
         
         pattern_type = analysis["pattern_type"]
         most_active_day = analysis["most_active_day"]
@@ -680,24 +1558,26 @@ class AnalysisView:
         weekend_avg = analysis["weekend_avg"]
         daily_averages = analysis["daily_averages"]
         
-        self.text.insert(tk.END, f"Weekly Pattern Type: {WEEKLY_PATTERN_TYPES[pattern_type]['name']}\n\n")
-        self.text.insert(tk.END, f"{WEEKLY_PATTERN_TYPES[pattern_type]['description']}\n\n")
+        lines = [
+            f"Weekly Pattern Type: {WEEKLY_PATTERN_TYPES[pattern_type]['name']}\n\n",
+            f"{WEEKLY_PATTERN_TYPES[pattern_type]['description']}\n\n",
+        ]
         
         if most_active_day:
-            self.text.insert(tk.END, f"Most Active Day: {most_active_day}\n")
+            lines.append(f"Most Active Day: {most_active_day}\n")
         if least_active_day:
-            self.text.insert(tk.END, f"Least Active Day: {least_active_day}\n\n")
+            lines.append(f"Least Active Day: {least_active_day}\n\n")
         
-        self.text.insert(tk.END, f"Weekday Average: {weekday_avg:.1f}\n")
-        self.text.insert(tk.END, f"Weekend Average: {weekend_avg:.1f}\n\n")
+        lines.append(f"Weekday Average: {weekday_avg:.1f}\n")
+        lines.append(f"Weekend Average: {weekend_avg:.1f}\n\n")
         
         # Add specific day analysis
-        self.text.insert(tk.END, "Daily Activity Levels:\n")
+        lines.append("Daily Activity Levels:\n")
         for day in DAYS_OF_WEEK:
             if day in daily_averages:
-                self.text.insert(tk.END, f"{day}: {daily_averages[day]:.1f}\n")
+                lines.append(f"{day}: {daily_averages[day]:.1f}\n")
         
-        self.text.config(state=tk.DISABLED)
+        self._show_text("".join(lines))
     
     def update_high_res_analysis(self, interval_seconds: int = 60) -> None:
         """Update analysis text for high-resolution view.
@@ -705,9 +1585,6 @@ class AnalysisView:
         Args:
             interval_seconds: Interval for candles in seconds
         """
-        self.text.config(state=tk.NORMAL)
-        self.text.delete(1.0, tk.END)
-        
         # Format interval for analysis
         if interval_seconds < 60:
             interval_str = f"{interval_seconds}-second"
@@ -718,19 +1595,30 @@ class AnalysisView:
         else:
             interval_str = f"{interval_seconds}-second"
         
-        self.text.insert(tk.END, f"High-Resolution View: Examining movement patterns with {interval_str} resolution.\n\n")
-        self.text.insert(tk.END, "The visualization groups 1-second data into candles for meaningful analysis.\n\n")
-        self.text.insert(tk.END, "Use the time window selectors above to focus on specific periods of interest.\n\n")
-        self.text.insert(tk.END, "Green candles indicate increasing activity, red candles indicate decreasing activity.")
+        self._show_text(
+            f"High-Resolution View: Examining movement patterns with {interval_str} resolution.\n\n"
+            "The visualization groups 1-second data into candles for meaningful analysis.\n\n"
+            "Use the time window selectors above to focus on specific periods of interest.\n\n"
+            "Green candles indicate increasing activity, red candles indicate decreasing activity."
+        )
+    
+    def _show_text(self, text: str) -> None:
+        """Replace the analysis text, skipping the widget update if it is unchanged.
         
+        Args:
+            text: Full analysis text to display
+        """
+        if text == self._shown_text:
+            return
+        self.text.config(state=tk.NORMAL)
+        self.text.delete(1.0, tk.END)
+        self.text.insert(tk.END, text)
         self.text.config(state=tk.DISABLED)
+        self._shown_text = text
     
     def clear(self) -> None:
         """Clear the analysis text."""
-        self.text.config(state=tk.NORMAL)
-        self.text.delete(1.0, tk.END)
-        self.text.insert(tk.END, "No analysis available.")
-        self.text.config(state=tk.DISABLED)
+        self._show_text("No analysis available.")
 
 
 class KinetiCandlesApp:
@@ -761,6 +1649,26 @@ class KinetiCandlesApp:
         self.candle_interval_seconds = 60  # Default to 1-minute candles
         self.simulation_active = False
         self.simulation_day_index = 0
+        self._sim_after_id: Optional[str] = None  # Pending simulation step, if any
+        
+        # Worker for slow data preparation kept off the Tk thread
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        # Process for rendering exports, started on the first export
+        self._export_pool: Optional[ProcessPoolExecutor] = None
+        
+        # Pending debounced view update (Tk after id)
+        self._pending_update_id: Optional[str] = None
+        
+        # Inputs of the view that update_view last drew
+        self._last_view_signature: Optional[Tuple] = None
+        
+        # Static info windows, hidden rather than destroyed when closed
+        self._pattern_guide_window: Optional[tk.Toplevel] = None
+        self._freq_window: Optional[tk.Toplevel] = None
+        self._adv_window: Optional[tk.Toplevel] = None
+        
+        # Last exported image as (view signature, encoded bytes)
+        self._export_cache: Optional[Tuple[Tuple, bytes]] = None
         
         # Create UI
         self.create_menu()
@@ -771,12 +1679,13 @@ class KinetiCandlesApp:
         menubar = tk.Menu(self.root)
         
         # File menu
-        file_menu = tk.Menu(menubar, tearoff=0)
-        file_menu.add_command(label="Load Accelerometer Data", command=self.load_data)
-        file_menu.add_command(label="Export Current View", command=self.export_view)
-        file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.quit)
-        menubar.add_cascade(label="File", menu=file_menu)
+        self.file_menu = tk.Menu(menubar, tearoff=0)
+        self.file_menu.add_command(label="Load Accelerometer Data", command=self.load_data)
+        self.file_menu.add_command(label="Export Current View", command=self.export_view)
+        self.file_menu.add_command(label="Export Data", command=self.export_data)
+        self.file_menu.add_separator()
+        self.file_menu.add_command(label="Exit", command=self.root.quit)
+        menubar.add_cascade(label="File", menu=self.file_menu)
         
         # View menu
         view_menu = tk.Menu(menubar, tearoff=0)
@@ -890,21 +1799,25 @@ class KinetiCandlesApp:
         ttk.Label(time_frame, text="From:").pack(side=tk.LEFT, padx=5)
         self.start_hour_var = tk.StringVar(value="08")
         start_hour_combo = ttk.Combobox(time_frame, textvariable=self.start_hour_var, width=5)
-        start_hour_combo['values'] = [f"{i:02d}" for i in range(24)]
+        start_hour_combo['values'] = HOURS_STR
         start_hour_combo.pack(side=tk.LEFT)
+        start_hour_combo.bind("<<ComboboxSelected>>", self.on_hour_changed)
+        start_hour_combo.bind("<Return>", self.on_hour_changed)
         
         # End hour selector
         ttk.Label(time_frame, text="To:").pack(side=tk.LEFT, padx=5)
         self.end_hour_var = tk.StringVar(value="10")
         end_hour_combo = ttk.Combobox(time_frame, textvariable=self.end_hour_var, width=5)
-        end_hour_combo['values'] = [f"{i:02d}" for i in range(24)]
+        end_hour_combo['values'] = HOURS_STR
         end_hour_combo.pack(side=tk.LEFT)
+        end_hour_combo.bind("<<ComboboxSelected>>", self.on_hour_changed)
+        end_hour_combo.bind("<Return>", self.on_hour_changed)
         
         # Add interval selector
         ttk.Label(time_frame, text="Candle Size:").pack(side=tk.LEFT, padx=5)
         self.interval_var = tk.StringVar(value="1 minute")
         interval_combo = ttk.Combobox(time_frame, textvariable=self.interval_var, width=10)
-        interval_combo['values'] = [name for name, _ in HIGHRES_INTERVALS]
+        interval_combo['values'] = HIGHRES_INTERVAL_NAMES
         interval_combo.pack(side=tk.LEFT)
         interval_combo.bind("<<ComboboxSelected>>", self.on_interval_selected)
         
@@ -922,19 +1835,23 @@ class KinetiCandlesApp:
         week_btn = ttk.Button(view_frame, text="Weekly", command=lambda: self.switch_view("week"))
         week_btn.pack(side=tk.LEFT, padx=2)
     
+    def on_hour_changed(self, event) -> None:
+        """Handle a new start or end hour for the high-resolution window."""
+        if self.current_view == "high_res":
+            self._schedule_update()
+    
     def on_interval_selected(self, event) -> None:
         """Handle interval selection from dropdown."""
         selected_interval = self.interval_var.get()
         
         # Find the corresponding seconds value
-        for name, seconds in HIGHRES_INTERVALS:
-            if name == selected_interval:
-                self.candle_interval_seconds = seconds
-                break
+        seconds = _NAME_TO_SEC.get(selected_interval)
+        if seconds is not None:
+            self.candle_interval_seconds = seconds
         
         # Update the view if we're already in high-res mode
         if self.current_view == "high_res":
-            self.update_high_res_view()
+            self._schedule_update()
     
     def set_candle_interval(self, seconds: int) -> None:
         """Set the candle interval and update the interval dropdown.
@@ -946,29 +1863,64 @@ class KinetiCandlesApp:
         self.candle_interval_seconds = seconds
         
         # Find the corresponding name and update the dropdown
-        for name, secs in HIGHRES_INTERVALS:
-            if secs == seconds:
-                self.interval_var.set(name)
-                break
+        name = _SEC_TO_NAME.get(seconds)
+        if name is not None:
+            self.interval_var.set(name)
         
         # Update the view if we're already in high-res mode
         if self.current_view == "high_res":
-            self.update_high_res_view()
+            self._schedule_update()
     
     def load_data(self) -> None:
-        """Load accelerometer data from a CSV file."""
+        """Load accelerometer data from a CSV or Parquet file."""
         filename = filedialog.askopenfilename(
             title="Select Accelerometer Data File",
-            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+            filetypes=[("CSV files", "*.csv"), ("Parquet files", "*.parquet"), ("All files", "*.*")]
         )
         
         if not filename:
             return
         
+        # Parse the file on a worker thread so the UI stays responsive
+        print(f"Loading data from {filename}...")
+        self.root.config(cursor="watch")
+        future = self._executor.submit(self.model.read_data, filename)
+        self.run_when_done(future,
+                           lambda data: self.on_data_loaded(filename, data),
+                           lambda e: messagebox.showerror("Error Loading Data", str(e)))
+    
+    def run_when_done(self, future: Future, on_done: Callable[[Any], None],
+                      on_error: Callable[[Exception], None]) -> None:
+        """Poll a background task and pass its outcome to a callback on the Tk thread.
+        
+        Args:
+            future: Future of the background task
+            on_done: Called with the task's result if it succeeded
+            on_error: Called with the exception if the task failed
+        """
+        if not future.done():
+            self.root.after(50, self.run_when_done, future, on_done, on_error)
+            return
+        
+        self.root.config(cursor="")
+        try:
+            result = future.result()
+        except Exception as e:
+            on_error(e)
+            return
+        on_done(result)
+    
+    def on_data_loaded(self, filename: str, data: pd.DataFrame) -> None:
+        """Install data read from a file and refresh the UI.
+        
+        Args:
+            filename: Path of the file that was read
+            data: DataFrame returned by the model's read_data
+        """
         try:
-            # Load the data using the model
-            print(f"Loading data from {filename}...")
-            self.model.load_data(filename)
+            # Store the data in the model
+            self.model.detect_data_resolution(data)
+            self.model.set_data(data)
             
             # Store this as user data
             self.user_data = self.model.data
@@ -978,6 +1930,7 @@ class KinetiCandlesApp:
             if self.simulation_active:
                 self.simulation_active = False
                 self.sim_btn.config(text="Use Sample Data")
+            self._cancel_simulation_step()
             
             # Update view
             self.update_view_label()
@@ -992,21 +1945,39 @@ class KinetiCandlesApp:
             else:
                 size_str = f"{file_size_kb:.2f} KB"
                 
-            messagebox.showinfo("Data Loaded", 
-                              f"Successfully loaded data from {os.path.basename(filename)}\n"
-                              f"File size: {size_str}\n"
-                              f"Number of rows: {len(self.model.data):,}\n"
-                              f"Date range: {self.model.data['timestamp'].min().date()} to "
-                              f"{self.model.data['timestamp'].max().date()}\n"
-                              f"Resolution: {'Second-level' if self.model.has_second_resolution else 'Minute-level'}")
+            # The sorted day list already holds the date range, so no extra pass over the rows;
+            # the dialog is deferred so the new view paints first
+            message = (f"Successfully loaded data from {os.path.basename(filename)}\n"
+                       f"File size: {size_str}\n"
+                       f"Number of rows: {len(self.model.data):,}\n"
+                       f"Date range: {self.model.days[0]} to {self.model.days[-1]}\n"
+                       f"Resolution: {'Second-level' if self.model.has_second_resolution else 'Minute-level'}")
+            self.root.after(0, lambda: messagebox.showinfo("Data Loaded", message))
             
         except Exception as e:
             messagebox.showerror("Error Loading Data", str(e))
     
+    def _schedule_update(self) -> None:
+        """Rebuild the current view once a burst of UI changes has settled."""
+        if self._pending_update_id is not None:
+            self.root.after_cancel(self._pending_update_id)
+        self._pending_update_id = self.root.after(UPDATE_DEBOUNCE_MS, self._do_update)
+    
+    def _do_update(self) -> None:
+        """Run the update scheduled by _schedule_update."""
+        self._pending_update_id = None
+        self.update_view()
+    
     def update_view(self) -> None:
         """Update the current view."""
         if self.model.data is None:
             return
+        
+        # Nothing to redraw if the view and everything it depends on are unchanged
+        signature = (self.model.data_version, self.current_view, self.model.current_day_index,
+                     self.start_hour_var.get(), self.end_hour_var.get(), self.candle_interval_seconds)
+        if signature == self._last_view_signature:
+            return
             
         try:
             if self.current_view == "day":
@@ -1015,12 +1986,16 @@ class KinetiCandlesApp:
                 self.update_week_view()
             elif self.current_view == "high_res":
                 self.update_high_res_view()
+            self._last_view_signature = signature
             
         except Exception as e:
             messagebox.showerror("Error Updating View", str(e))
     
     def update_day_view(self) -> None:
         """Update the day view."""
+        # Direct calls bypass update_view, so forget what it last drew
+        self._last_view_signature = None
+        
         # Get current date
         current_date = self.model.get_current_date()
         if current_date is None:
@@ -1035,22 +2010,26 @@ class KinetiCandlesApp:
             return
         
         # Update chart
-        self.chart_view.plot_day_view(hourly_data, current_date)
+        self.chart_view.plot_cached("day", (self.model.data_version, "day", current_date),
+                                    self.chart_view.plot_day_view, hourly_data, current_date)
         
         # Update analysis
         day_analysis = self.model.analyze_day_patterns()
         self.analysis_view.update_day_analysis(day_analysis)
         
-        # Force immediate update
-        self.root.update()
+        # Flush pending redraws without re-entering the event loop
+        self.root.update_idletasks()
     
     def update_week_view(self) -> None:
         """Update the week view."""
+        self._last_view_signature = None
+        
         # Get weekly data
         weekly_data = self.model.get_weekly_data()
         
         # Update chart
-        self.chart_view.plot_week_view(weekly_data)
+        self.chart_view.plot_cached("week", (self.model.data_version, "week"),
+                                    self.chart_view.plot_week_view, weekly_data)
         
         # Update analysis
         week_analysis = self.model.analyze_week_patterns()
@@ -1058,6 +2037,8 @@ class KinetiCandlesApp:
     
     def update_high_res_view(self) -> None:
         """Update the high-resolution view with the selected time window."""
+        self._last_view_signature = None
+        
         try:
             # Get hour values from UI
             self.selected_start_hour = int(self.start_hour_var.get())
@@ -1085,18 +2066,15 @@ class KinetiCandlesApp:
             if current_date is None:
                 return
             
-            # Get high-resolution data
-            window_data = self.model.get_high_resolution_data(
-                self.selected_start_hour, self.selected_end_hour
+            # Get candles for the window at the selected interval
+            candle_data = self.model.get_window_candles(
+                self.selected_start_hour, self.selected_end_hour, self.candle_interval_seconds
             )
             
-            if window_data is None or len(window_data) == 0:
+            if candle_data is None:
                 self.chart_view.clear()
                 messagebox.showinfo("No Data", f"No data available for the {self.selected_start_hour}:00-{self.selected_end_hour}:00 time window")
                 return
-                
-            # Process into candles with the selected interval
-            candle_data = self.model.get_candle_data(window_data, self.candle_interval_seconds)
             
             if len(candle_data) == 0:
                 self.chart_view.clear()
@@ -1106,7 +2084,10 @@ class KinetiCandlesApp:
                 return
             
             # Update chart
-            self.chart_view.plot_high_resolution_view(
+            key = (self.model.data_version, "high_res", current_date, self.selected_start_hour,
+                   self.selected_end_hour, self.candle_interval_seconds)
+            self.chart_view.plot_cached(
+                "high_res", key, self.chart_view.plot_high_resolution_view,
                 candle_data, current_date, 
                 self.selected_start_hour, self.selected_end_hour,
                 self.candle_interval_seconds
@@ -1172,7 +2153,7 @@ class KinetiCandlesApp:
             
         self.model.next_day()
         self.update_view_label()
-        self.update_view()
+        self._schedule_update()
     
     def previous_day(self) -> None:
         """Navigate to the previous day."""
@@ -1181,7 +2162,7 @@ class KinetiCandlesApp:
             
         self.model.previous_day()
         self.update_view_label()
-        self.update_view()
+        self._schedule_update()
     
     def on_day_selected(self, event) -> None:
         """Handle day selection from dropdown for week view."""
@@ -1200,7 +2181,7 @@ class KinetiCandlesApp:
         self.model.current_day_index = day_index
         self.current_view = "day"  # Switch to day view
         self.update_view_label()
-        self.update_view()
+        self._schedule_update()
     
     def toggle_simulation(self) -> None:
         """Toggle between user data and sample data."""
@@ -1209,10 +2190,9 @@ class KinetiCandlesApp:
             if self.user_data is not None:
                 self.simulation_active = False
                 self.using_sample_data = False
-                self.model.data = self.user_data
+                self._cancel_simulation_step()
                 self.model.detect_data_resolution(self.user_data)
-                self.model.days = sorted(self.model.data['timestamp'].dt.date.unique())
-                self.model.current_day_index = 0
+                self.model.set_data(self.user_data)
                 
                 # Update button and title
                 self.sim_btn.config(text="Use Sample Data")
@@ -1227,35 +2207,63 @@ class KinetiCandlesApp:
             else:
                 messagebox.showinfo("No User Data", "You haven't loaded any data yet. Please use the 'Load Data' button.")
         else:
-            # Switch to sample data
-            self.using_sample_data = True
-            self.simulation_active = True
-            
-            # Generate sample data
-            sample_df = generate_high_res_sample_data()
-            
-            # Load the sample data
-            self.model.data = sample_df
-            self.model.has_second_resolution = True
-            self.model.days = sorted(self.model.data['timestamp'].dt.date.unique())
-            self.model.current_day_index = 0
-            
-            # Update button and title
-            self.sim_btn.config(text="Use My Data")
-            self.root.title("KinetiCandles: Using Sample Data")
-            
-            # Update view
-            self.current_view = "day"
-            self.update_view_label()
-            self.update_view()
-            
-            messagebox.showinfo("Sample Data Loaded", 
-                              "Now using built-in sample data with 1-second resolution.\n\n"
-                              "This data contains simulated activity patterns for a full week.\n\n"
-                              "Click 'Use My Data' to switch back to your loaded data.")
+            # Generate sample data on the worker so the UI stays responsive
+            self.sim_btn.config(state=tk.DISABLED)
+            self.root.config(cursor="watch")
+            future = self._executor.submit(generate_high_res_sample_data)
+            self.run_when_done(future, self.on_sample_data_generated, self.on_sample_data_failed)
+    
+    def on_sample_data_generated(self, sample_df: pd.DataFrame) -> None:
+        """Switch to freshly generated sample data and refresh the UI.
+        
+        Args:
+            sample_df: DataFrame returned by generate_high_res_sample_data
+        """
+        # Switch to sample data
+        self.using_sample_data = True
+        self.simulation_active = True
+        self._cancel_simulation_step()
+        
+        # Load the sample data
+        self.model.set_data(sample_df)
+        self.model.has_second_resolution = True
+        
+        # Update button and title
+        self.sim_btn.config(text="Use My Data", state=tk.NORMAL)
+        self.root.title("KinetiCandles: Using Sample Data")
+        
+        # Update view
+        self.current_view = "day"
+        self.update_view_label()
+        self.update_view()
+        
+        messagebox.showinfo("Sample Data Loaded", 
+                          "Now using built-in sample data with 1-second resolution.\n\n"
+                          "This data contains simulated activity patterns for a full week.\n\n"
+                          "Click 'Use My Data' to switch back to your loaded data.")
+    
+    def on_sample_data_failed(self, error: Exception) -> None:
+        """Report a failure to generate sample data.
+        
+        Args:
+            error: Exception raised by the generator
+        """
+        self.sim_btn.config(state=tk.NORMAL)
+        messagebox.showerror("Error", f"Could not generate sample data: {error}")
+    
+    def _cancel_simulation_step(self) -> None:
+        """Cancel the scheduled simulation step, e.g. when the data source changes."""
+        if self._sim_after_id is not None:
+            self.root.after_cancel(self._sim_after_id)
+            self._sim_after_id = None
     
     def simulation_step(self) -> None:
-        """Perform a single step in the simulation."""
+        """Perform a single step in the simulation.
+        
+        Each step reschedules the next one, but nothing schedules the first step
+        yet: loading sample data sets simulation_active without starting playback.
+        """
+        self._sim_after_id = None
         if not self.simulation_active:
             return
             
@@ -1289,7 +2297,7 @@ class KinetiCandlesApp:
         else:
             # Schedule the next update if simulation is still active
             if self.simulation_active:
-                self.root.after(3000, self.simulation_step)
+                self._sim_after_id = self.root.after(3000, self.simulation_step)
     
     def export_view(self) -> None:
         """Export the current view as an image."""
@@ -1305,16 +2313,106 @@ class KinetiCandlesApp:
         
         if file_path:
             try:
-                self.chart_view.fig.savefig(file_path, dpi=300, bbox_inches='tight')
-                messagebox.showinfo("Export Successful", f"Chart saved to {file_path}")
+                # Re-exporting an unchanged view reuses the last rendered image
+                image_format = os.path.splitext(file_path)[1].lstrip('.').lower() or 'png'
+                signature = (self.model.data_version, self.current_view, self.model.get_current_date(),
+                             self.selected_start_hour, self.selected_end_hour,
+                             self.candle_interval_seconds, self.chart_view.canvas.get_width_height(),
+                             image_format)
+                if self._export_cache is not None and self._export_cache[0] == signature:
+                    with open(file_path, 'wb') as f:
+                        f.write(self._export_cache[1])
+                    messagebox.showinfo("Export Successful", f"Chart saved to {file_path}")
+                    return
+                
+                # Render a snapshot of the figure in a separate process; a 300 dpi render
+                # is CPU-bound Python work that would stall the Tk loop from a thread
+                self.chart_view.ensure_current()
+                snapshot = pickle.dumps(self.chart_view.fig)
+                if self._export_pool is None:
+                    self._export_pool = ProcessPoolExecutor(
+                        max_workers=1, mp_context=multiprocessing.get_context('spawn')
+                    )
+                future = self._export_pool.submit(_render_figure, snapshot, image_format, file_path)
             except Exception as e:
                 messagebox.showerror("Export Error", str(e))
+                return
+            
+            self.file_menu.entryconfig("Export Current View", state=tk.DISABLED)
+            self.root.config(cursor="watch")
+            self.run_when_done(future,
+                               lambda image: self.on_export_done(signature, file_path, image),
+                               self.on_export_failed)
+    
+    def on_export_done(self, signature: Tuple, file_path: str, image: bytes) -> None:
+        """Remember an exported image and report success.
+        
+        Args:
+            signature: View signature the image was rendered for
+            file_path: Path the image was written to
+            image: Encoded image bytes
+        """
+        self._export_cache = (signature, image)
+        self.file_menu.entryconfig("Export Current View", state=tk.NORMAL)
+        messagebox.showinfo("Export Successful", f"Chart saved to {file_path}")
+    
+    def on_export_failed(self, error: Exception) -> None:
+        """Report a failed export.
+        
+        Args:
+            error: Exception raised while rendering or writing the image
+        """
+        self.file_menu.entryconfig("Export Current View", state=tk.NORMAL)
+        messagebox.showerror("Export Error", str(error))
+    
+    def export_data(self) -> None:
+        """Export the loaded activity data, as Parquet unless CSV is chosen."""
+        if self.model.data is None:
+            messagebox.showinfo("No Data", "Please load data first")
+            return
+        
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".parquet",
+            filetypes=[("Parquet files", "*.parquet"), ("CSV files", "*.csv"), ("All files", "*.*")],
+            title="Save Data As"
+        )
+        
+        if file_path:
+            # set_data replaces the model's frame rather than modifying it in place,
+            # so the worker can write it while the UI keeps running
+            future = self._executor.submit(self.model.write_data, self.model.data, file_path)
+            self.file_menu.entryconfig("Export Data", state=tk.DISABLED)
+            self.root.config(cursor="watch")
+            self.run_when_done(future,
+                               lambda _: self.on_data_export_finished(file_path, None),
+                               lambda e: self.on_data_export_finished(file_path, e))
+    
+    def on_data_export_finished(self, file_path: str, error: Optional[Exception]) -> None:
+        """Re-enable data export and report the outcome.
+        
+        Args:
+            file_path: Path the data was written to
+            error: Exception raised while writing, or None on success
+        """
+        self.file_menu.entryconfig("Export Data", state=tk.NORMAL)
+        if error is None:
+            messagebox.showinfo("Export Successful", f"Data saved to {file_path}")
+        else:
+            messagebox.showerror("Export Error", str(error))
     
     def show_pattern_guide(self) -> None:
         """Show the pattern guide window."""
+        # The guide is static, so build it once and re-show the same window
+        if self._pattern_guide_window is not None and self._pattern_guide_window.winfo_exists():
+            self._pattern_guide_window.deiconify()
+            self._pattern_guide_window.lift()
+            return
+        
         guide_window = tk.Toplevel(self.root)
         guide_window.title("KinetiCandles Pattern Guide")
         guide_window.geometry("600x500")
+        guide_window.protocol("WM_DELETE_WINDOW", guide_window.withdraw)
+        self._pattern_guide_window = guide_window
         
         # Create scrollable text area
         frame = ttk.Frame(guide_window)
@@ -1327,52 +2425,55 @@ class KinetiCandlesApp:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         text.config(yscrollcommand=scrollbar.set)
         
-        # Add pattern guide content
-        text.insert(tk.END, "KinetiCandles: Movement Pattern Reference Guide\n\n", "title")
-        text.insert(tk.END, "=" * 50 + "\n\n")
+        # Collect the guide as alternating (text, tags) items for a single insert
+        parts: List[Any] = []
+        parts += ["KinetiCandles: Movement Pattern Reference Guide\n\n", "title"]
+        parts += ["=" * 50 + "\n\n", ()]
         
         # Daily patterns
-        text.insert(tk.END, "Daily Patterns\n\n", "section")
+        parts += ["Daily Patterns\n\n", "section"]
         
         for pattern_id, pattern_info in PATTERN_TYPES.items():
-            text.insert(tk.END, f"{pattern_info['name']}\n", "heading")
-            text.insert(tk.END, "-" * 20 + "\n")
-            text.insert(tk.END, f"{pattern_info['description']}\n\n")
+            parts += [f"{pattern_info['name']}\n", "heading"]
+            parts += ["-" * 20 + "\n", ()]
+            parts += [f"{pattern_info['description']}\n\n", ()]
             
             # Add additional info based on pattern type
             if pattern_id == "morning_peak":
-                text.insert(tk.END, "Visual Signature: Tall green candles in morning hours (6-9am) with progressively smaller candles afterward\n\n")
-                text.insert(tk.END, "Health Implications: Often associated with good sleep hygiene and regular circadian rhythm\n\n")
+                parts += ["Visual Signature: Tall green candles in morning hours (6-9am) with progressively smaller candles afterward\n\n", ()]
+                parts += ["Health Implications: Often associated with good sleep hygiene and regular circadian rhythm\n\n", ()]
             elif pattern_id == "evening_peak":
-                text.insert(tk.END, "Visual Signature: Small morning candles with progressively larger candles in evening (5-8pm)\n\n")
-                text.insert(tk.END, "Health Implications: May indicate delayed circadian rhythm or night owl chronotype\n\n")
+                parts += ["Visual Signature: Small morning candles with progressively larger candles in evening (5-8pm)\n\n", ()]
+                parts += ["Health Implications: May indicate delayed circadian rhythm or night owl chronotype\n\n", ()]
             elif pattern_id == "bimodal":
-                text.insert(tk.END, "Visual Signature: Two distinct peaks (morning and evening) with a mid-day trough\n\n")
-                text.insert(tk.END, "Health Implications: Often seen in people with structured work schedules\n\n")
+                parts += ["Visual Signature: Two distinct peaks (morning and evening) with a mid-day trough\n\n", ()]
+                parts += ["Health Implications: Often seen in people with structured work schedules\n\n", ()]
         
         # Weekly patterns
-        text.insert(tk.END, "Weekly Patterns\n\n", "section")
+        parts += ["Weekly Patterns\n\n", "section"]
         
         for pattern_id, pattern_info in WEEKLY_PATTERN_TYPES.items():
-            text.insert(tk.END, f"{pattern_info['name']}\n", "heading")
-            text.insert(tk.END, "-" * 20 + "\n")
-            text.insert(tk.END, f"{pattern_info['description']}\n\n")
+            parts += [f"{pattern_info['name']}\n", "heading"]
+            parts += ["-" * 20 + "\n", ()]
+            parts += [f"{pattern_info['description']}\n\n", ()]
             
         # High-resolution patterns
-        text.insert(tk.END, "High-Resolution Patterns\n\n", "section")
-        text.insert(tk.END, "Second-by-Second Analysis\n", "heading")
-        text.insert(tk.END, "-" * 20 + "\n")
-        text.insert(tk.END, "The high-resolution view allows analysis of moment-to-moment activity patterns.\n\n")
-        text.insert(tk.END, "Candlestick Interpretation:\n")
-        text.insert(tk.END, "• Green candles: Activity increased during the time interval\n")
-        text.insert(tk.END, "• Red candles: Activity decreased during the time interval\n")
-        text.insert(tk.END, "• Tall wicks: High volatility within the time period\n")
-        text.insert(tk.END, "• Short bodies: Opening and closing activity levels were similar\n\n")
-        
-        text.insert(tk.END, "Common Micro-Patterns:\n")
-        text.insert(tk.END, "• Activity Bursts: Clusters of tall green candles indicate intense, short-duration activity\n")
-        text.insert(tk.END, "• Rest Intervals: Series of red candles with low activity levels\n")
-        text.insert(tk.END, "• Transition Phases: Alternating red and green candles of increasing/decreasing height\n\n")
+        parts += ["High-Resolution Patterns\n\n", "section"]
+        parts += ["Second-by-Second Analysis\n", "heading"]
+        parts += ["-" * 20 + "\n", ()]
+        parts += ["The high-resolution view allows analysis of moment-to-moment activity patterns.\n\n", ()]
+        parts += ["Candlestick Interpretation:\n", ()]
+        parts += ["• Green candles: Activity increased during the time interval\n", ()]
+        parts += ["• Red candles: Activity decreased during the time interval\n", ()]
+        parts += ["• Tall wicks: High volatility within the time period\n", ()]
+        parts += ["• Short bodies: Opening and closing activity levels were similar\n\n", ()]
+        
+        parts += ["Common Micro-Patterns:\n", ()]
+        parts += ["• Activity Bursts: Clusters of tall green candles indicate intense, short-duration activity\n", ()]
+        parts += ["• Rest Intervals: Series of red candles with low activity levels\n", ()]
+        parts += ["• Transition Phases: Alternating red and green candles of increasing/decreasing height\n\n", ()]
+        
+        text.insert(tk.END, *parts)
         
         # Format text
         text.tag_configure("title", font=("Arial", 14, "bold"))
@@ -1429,72 +2530,85 @@ class KinetiCandlesApp:
             analysis_type: Type of analysis to perform
             result_text: Text widget to display results
         """
-        # Clear previous results
-        result_text.delete(1.0, tk.END)
-        result_text.insert(tk.END, f"Calculating {analysis_type} time domain analysis...\n\n")
+        # Build the report, then replace the previous results in one Tk call
+        lines = [f"Calculating {analysis_type} time domain analysis...\n\n"]
         
         try:
             # Get current day data
             day_data = self.model.get_data_for_current_day()
             
             if day_data is None or len(day_data) == 0:
-                result_text.insert(tk.END, "No data available for the current day.")
-                return
+                lines.append("No data available for the current day.")
                 
             # Perform analysis based on type
-            if analysis_type == "basic":
+            elif analysis_type == "basic":
                 # Basic statistics
-                stats = day_data['activity_level'].describe()
+                stats = self.model.get_daily_statistics()
                 
-                result_text.insert(tk.END, f"Basic Statistics for {self.model.get_current_date()}\n\n")
-                result_text.insert(tk.END, f"Count: {stats['count']:.0f} data points\n")
-                result_text.insert(tk.END, f"Mean: {stats['mean']:.2f}\n")
-                result_text.insert(tk.END, f"Standard Deviation: {stats['std']:.2f}\n")
-                result_text.insert(tk.END, f"Minimum: {stats['min']:.2f}\n")
-                result_text.insert(tk.END, f"25th Percentile: {stats['25%']:.2f}\n")
-                result_text.insert(tk.END, f"Median: {stats['50%']:.2f}\n")
-                result_text.insert(tk.END, f"75th Percentile: {stats['75%']:.2f}\n")
-                result_text.insert(tk.END, f"Maximum: {stats['max']:.2f}\n")
+                lines.extend([
+                    f"Basic Statistics for {self.model.get_current_date()}\n\n",
+                    f"Count: {stats['count']:.0f} data points\n",
+                    f"Mean: {stats['mean']:.2f}\n",
+                    f"Standard Deviation: {stats['std']:.2f}\n",
+                    f"Minimum: {stats['min']:.2f}\n",
+                    f"25th Percentile: {stats['25%']:.2f}\n",
+                    f"Median: {stats['50%']:.2f}\n",
+                    f"75th Percentile: {stats['75%']:.2f}\n",
+                    f"Maximum: {stats['max']:.2f}\n",
+                ])
                 
             elif analysis_type == "counts":
                 # Activity counts
-                result_text.insert(tk.END, f"Activity Counts for {self.model.get_current_date()}\n\n")
+                lines.append(f"Activity Counts for {self.model.get_current_date()}\n\n")
                 
-                # Count activity levels by intensity
-                low = len(day_data[day_data['activity_level'] < 30])
-                moderate = len(day_data[(day_data['activity_level'] >= 30) & (day_data['activity_level'] < 60)])
-                high = len(day_data[day_data['activity_level'] >= 60])
+                # Count activity levels by intensity in a single pass
+                activity = day_data['activity_level'].to_numpy()
+                counts = np.histogram(activity, bins=ACTIVITY_COUNT_BINS)[0]
                 
-                result_text.insert(tk.END, f"Total data points: {len(day_data)}\n")
-                result_text.insert(tk.END, f"Low activity counts (<30): {low} ({low/len(day_data)*100:.1f}%)\n")
-                result_text.insert(tk.END, f"Moderate activity counts (30-59): {moderate} ({moderate/len(day_data)*100:.1f}%)\n")
-                result_text.insert(tk.END, f"High activity counts (60+): {high} ({high/len(day_data)*100:.1f}%)\n\n")
+                lines.append(f"Total data points: {len(day_data)}\n")
+                lines.extend(f"{label}: {count} ({count/len(day_data)*100:.1f}%)\n"
+                             for label, count in zip(ACTIVITY_COUNT_LABELS, counts))
+                lines.append("\n")
                 
-                # Find peak activity periods
-                hourly = day_data.groupby(day_data['timestamp'].dt.hour)['activity_level'].mean()
-                peak_hour = hourly.idxmax()
-                result_text.insert(tk.END, f"Peak activity hour: {peak_hour:02d}:00 (Average: {hourly[peak_hour]:.1f})\n")
+                # Find peak activity periods: hours are a small dense key, so a
+                # weighted bincount replaces the hash-based groupby
+                hours = day_data['hour'].to_numpy()
+                valid = ~np.isnan(activity)
+                sums = np.bincount(hours[valid], weights=activity[valid], minlength=24)
+                cnts = np.bincount(hours[valid], minlength=24)
+                hourly = np.divide(sums, cnts, out=np.full(24, -np.inf), where=cnts > 0)
+                peak_hour = int(hourly.argmax())
+                lines.append(f"Peak activity hour: {peak_hour:02d}:00 (Average: {hourly[peak_hour]:.1f})\n")
                 
             elif analysis_type == "moving_avg":
                 # Moving averages
-                result_text.insert(tk.END, f"Moving Averages for {self.model.get_current_date()}\n\n")
+                lines.append(f"Moving Averages for {self.model.get_current_date()}\n\n")
                 
                 # Calculate different window sizes based on data resolution
                 if self.model.has_second_resolution:
-                    result_text.insert(tk.END, "Calculated with 1-second resolution data:\n")
-                    result_text.insert(tk.END, "- 1-minute moving average\n")
-                    result_text.insert(tk.END, "- 5-minute moving average\n")
-                    result_text.insert(tk.END, "- 15-minute moving average\n\n")
+                    lines.extend([
+                        "Calculated with 1-second resolution data:\n",
+                        "- 1-minute moving average\n",
+                        "- 5-minute moving average\n",
+                        "- 15-minute moving average\n\n",
+                    ])
                 else:
-                    result_text.insert(tk.END, "Calculated with minute/hour resolution data:\n")
-                    result_text.insert(tk.END, "- 1-hour moving average\n")
-                    result_text.insert(tk.END, "- 3-hour moving average\n\n")
+                    lines.extend([
+                        "Calculated with minute/hour resolution data:\n",
+                        "- 1-hour moving average\n",
+                        "- 3-hour moving average\n\n",
+                    ])
                 
-                result_text.insert(tk.END, "Note: To visualize moving averages, use the main view with K-Line enabled.\n")
-                result_text.insert(tk.END, "The K-Line in the main chart shows the moving average for the selected view.")
+                lines.extend([
+                    "Note: To visualize moving averages, use the main view with K-Line enabled.\n",
+                    "The K-Line in the main chart shows the moving average for the selected view.",
+                ])
                 
         except Exception as e:
-            result_text.insert(tk.END, f"Error calculating time domain metrics: {str(e)}")
+            lines.append(f"Error calculating time domain metrics: {str(e)}")
+        
+        result_text.delete(1.0, tk.END)
+        result_text.insert(tk.END, "".join(lines))
     
     def show_frequency_domain_analysis(self) -> None:
         """Show frequency domain analysis window."""
@@ -1502,10 +2616,17 @@ class KinetiCandlesApp:
             messagebox.showinfo("No Data", "Please load data first")
             return
             
-        # Create a new window for frequency domain analysis
+        # The window content is static, so build it once and re-show the same window
+        if self._freq_window is not None and self._freq_window.winfo_exists():
+            self._freq_window.deiconify()
+            self._freq_window.lift()
+            return
+        
         freq_window = tk.Toplevel(self.root)
         freq_window.title("Frequency Domain Analysis")
         freq_window.geometry("800x600")
+        freq_window.protocol("WM_DELETE_WINDOW", freq_window.withdraw)
+        self._freq_window = freq_window
         
         # Add content to the window
         frame = ttk.Frame(freq_window, padding="10")
@@ -1536,14 +2657,10 @@ class KinetiCandlesApp:
         button_frame.pack(pady=20)
         
         ttk.Button(button_frame, text="Analyze Current Day", 
-                  command=lambda: messagebox.showinfo("Frequency Analysis", 
-                                                    "This would perform FFT analysis on the current day's data.\n\n"
-                                                    "In a full implementation, it would show frequency components and power spectrum.")).pack(side=tk.LEFT, padx=10)
+                  command=lambda: self._show_analysis_message('fft_day')).pack(side=tk.LEFT, padx=10)
         
         ttk.Button(button_frame, text="Analyze Selected Window", 
-                  command=lambda: messagebox.showinfo("Frequency Analysis", 
-                                                    "This would perform FFT analysis on the current high-resolution window.\n\n"
-                                                    "For best results, select a 1-2 hour window with 1-second data.")).pack(side=tk.LEFT, padx=10)
+                  command=lambda: self._show_analysis_message('fft_window')).pack(side=tk.LEFT, padx=10)
     
     def show_advanced_measures(self) -> None:
         """Show other advanced analysis measures."""
@@ -1551,10 +2668,17 @@ class KinetiCandlesApp:
             messagebox.showinfo("No Data", "Please load data first")
             return
             
-        # Create a new window for advanced measures
+        # The window content is static, so build it once and re-show the same window
+        if self._adv_window is not None and self._adv_window.winfo_exists():
+            self._adv_window.deiconify()
+            self._adv_window.lift()
+            return
+        
         adv_window = tk.Toplevel(self.root)
         adv_window.title("Advanced Activity Measures")
         adv_window.geometry("800x600")
+        adv_window.protocol("WM_DELETE_WINDOW", adv_window.withdraw)
+        self._adv_window = adv_window
         
         # Add content to the window
         frame = ttk.Frame(adv_window, padding="10")
@@ -1578,35 +2702,31 @@ class KinetiCandlesApp:
         # Add content to entropy tab
         ttk.Label(entropy_tab, text="Entropy measures quantify randomness and predictability in activity patterns.", font=("Arial", 11)).pack(pady=10)
         ttk.Button(entropy_tab, text="Calculate Sample Entropy", 
-                  command=lambda: messagebox.showinfo("Advanced Analysis", 
-                                                    "This would calculate sample entropy for the activity data.\n\n"
-                                                    "Sample entropy measures the complexity/regularity of time series data.")).pack(pady=5)
+                  command=lambda: self._show_analysis_message('sample_entropy')).pack(pady=5)
         ttk.Button(entropy_tab, text="Calculate Approximate Entropy", 
-                  command=lambda: messagebox.showinfo("Advanced Analysis", 
-                                                    "This would calculate approximate entropy for the activity data.\n\n"
-                                                    "ApEn quantifies the unpredictability of fluctuations in the data.")).pack(pady=5)
+                  command=lambda: self._show_analysis_message('approximate_entropy')).pack(pady=5)
         
         # Add content to complexity tab
         ttk.Label(complexity_tab, text="Complexity metrics measure the structural complexity of activity patterns.", font=("Arial", 11)).pack(pady=10)
         ttk.Button(complexity_tab, text="Calculate Fractal Dimension", 
-                  command=lambda: messagebox.showinfo("Advanced Analysis", 
-                                                    "This would calculate fractal dimension for the activity data.\n\n"
-                                                    "Fractal dimension measures how activity patterns fill space across different time scales.")).pack(pady=5)
+                  command=lambda: self._show_analysis_message('fractal_dimension')).pack(pady=5)
         ttk.Button(complexity_tab, text="Calculate Detrended Fluctuation Analysis", 
-                  command=lambda: messagebox.showinfo("Advanced Analysis", 
-                                                    "This would perform DFA on the activity data.\n\n"
-                                                    "DFA identifies long-range correlations and scaling properties in the data.")).pack(pady=5)
+                  command=lambda: self._show_analysis_message('dfa')).pack(pady=5)
         
         # Add content to pattern tab
         ttk.Label(pattern_tab, text="Pattern recognition identifies recurring activity patterns.", font=("Arial", 11)).pack(pady=10)
         ttk.Button(pattern_tab, text="Find Repeating Patterns", 
-                  command=lambda: messagebox.showinfo("Advanced Analysis", 
-                                                    "This would identify repeating activity patterns.\n\n"
-                                                    "This analysis finds recurring movement sequences across different time periods.")).pack(pady=5)
+                  command=lambda: self._show_analysis_message('repeating_patterns')).pack(pady=5)
         ttk.Button(pattern_tab, text="Cluster Similar Activities", 
-                  command=lambda: messagebox.showinfo("Advanced Analysis", 
-                                                    "This would cluster similar activity patterns.\n\n"
-                                                    "Clustering groups similar movement patterns to identify common behaviors.")).pack(pady=5)
+                  command=lambda: self._show_analysis_message('clustering')).pack(pady=5)
+    
+    def _show_analysis_message(self, key: str) -> None:
+        """Show the placeholder description for an analysis button.
+        
+        Args:
+            key: Entry in ANALYSIS_MESSAGES
+        """
+        messagebox.showinfo(*ANALYSIS_MESSAGES[key])
     
     def show_about(self) -> None:
         """Show about dialog."""
@@ -1637,171 +2757,94 @@ class KinetiCandlesApp:
 
 
 # Data generator functions for testing
-def generate_sample_data() -> pd.DataFrame:
-    """Generate sample accelerometer data for testing."""
-    # Create a week of data
+def _activity_params(hour_of_week: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Look up the simulated activity distribution for each hour of the week.
+    
+    Args:
+        hour_of_week: Hours since Monday 00:00 (0-167)
+        
+    Returns:
+        Tuple of (floor, mean, std) arrays for the base activity level
+    """
+    params = WEEK_ACTIVITY_PARAMS[hour_of_week % len(WEEK_ACTIVITY_PARAMS)]
+    return params[:, 0], params[:, 1], params[:, 2]
+
+
+def generate_sample_data(seed: Optional[int] = None) -> pd.DataFrame:
+    """Generate sample accelerometer data for testing.
+    
+    Args:
+        seed: Seed for the random generator, or None for fresh entropy
+    """
+    rng = np.random.default_rng(seed)
+    
+    # Create a week of hourly data
     start_date = datetime.datetime(2023, 5, 1)
     days = 7
+    timestamps = pd.date_range(start_date, periods=days * 24, freq='h')
     
-    # Create empty dataframe
-    data = []
+    # Morning person pattern: look up each hour's activity period at once
+    floor, mean, std = _activity_params(np.arange(days * 24))
+    activity = np.maximum(floor, rng.normal(mean, std)).astype(np.float32)
     
-    # Generate data points for each day
-    for day in range(days):
-        current_date = start_date + datetime.timedelta(days=day)
-        
-        # Generate 24 hourly data points
-        for hour in range(24):
-            timestamp = current_date + datetime.timedelta(hours=hour)
-            
-            # Create activity pattern
-            # Morning person pattern: high activity in morning
-            if day < 5:  # Weekday
-                if hour < 6:  # Sleep
-                    activity = max(5, np.random.normal(10, 5))
-                elif 6 <= hour < 9:  # Morning activity peak
-                    activity = max(10, np.random.normal(70, 15))
-                elif 9 <= hour < 12:  # Work morning
-                    activity = max(10, np.random.normal(40, 10))
-                elif 12 <= hour < 14:  # Lunch
-                    activity = max(10, np.random.normal(60, 15))
-                elif 14 <= hour < 17:  # Work afternoon
-                    activity = max(10, np.random.normal(35, 10))
-                elif 17 <= hour < 19:  # Evening commute/exercise
-                    activity = max(10, np.random.normal(65, 15))
-                elif 19 <= hour < 22:  # Evening leisure
-                    activity = max(10, np.random.normal(30, 10))
-                else:  # Wind down for sleep
-                    activity = max(5, np.random.normal(15, 5))
-            else:  # Weekend
-                if hour < 8:  # Sleep longer
-                    activity = max(5, np.random.normal(10, 5))
-                elif 8 <= hour < 11:  # Morning leisure
-                    activity = max(10, np.random.normal(40, 10))
-                elif 11 <= hour < 15:  # Weekend activities
-                    activity = max(10, np.random.normal(75, 20))
-                elif 15 <= hour < 19:  # Afternoon activities
-                    activity = max(10, np.random.normal(65, 15))
-                elif 19 <= hour < 23:  # Evening leisure
-                    activity = max(10, np.random.normal(45, 15))
-                else:  # Late night
-                    activity = max(5, np.random.normal(20, 10))
-            
-            # Add some random variation to make data realistic
-            activity += np.random.normal(0, 5)
-            activity = max(0, min(100, activity))  # Constrain between 0-100
-            
-            # Add to data list
-            data.append({
-                'timestamp': timestamp,
-                'activity_level': activity
-            })
+    # Add some random variation to make data realistic
+    activity += rng.normal(0, 5, len(activity)).astype(np.float32)
+    np.clip(activity, 0, 100, out=activity)  # Constrain between 0-100
     
-    # Convert to DataFrame
-    df = pd.DataFrame(data)
+    df = pd.DataFrame({'timestamp': timestamps, 'activity_level': activity})
     
-    # Add day_of_week column
-    df['day_of_week'] = df['timestamp'].dt.day_name()
+    # Add day_of_week column as a categorical; each day is one block of 24 hours
+    weekdays = (start_date.weekday() + np.arange(days)) % 7
+    df['day_of_week'] = pd.Categorical.from_codes(np.repeat(weekdays, 24), categories=DAYS_OF_WEEK,
+                                                  ordered=True)
     
     return df
 
 
-def generate_high_res_sample_data() -> pd.DataFrame:
+def generate_high_res_sample_data(seed: Optional[int] = None) -> pd.DataFrame:
     """Generate high-resolution sample accelerometer data for testing.
     
     Returns a complete dataset with 1-second resolution for all days.
     Note that for performance reasons, when using this data, it's 
     recommended to limit the time window to 1-2 hours.
+    
+    Args:
+        seed: Seed for the random generator, or None for fresh entropy
     """
+    rng = np.random.default_rng(seed)
+    
     # Create a week of data with 1-second intervals for high-resolution analysis
     start_date = datetime.datetime(2023, 5, 1)
     days = 7
-    interval_seconds = 1  # 1-second intervals
-    
-    # Create empty dataframe
-    data = []
-    
-    # Generate data points for each day
-    for day in range(days):
-        current_date = start_date + datetime.timedelta(days=day)
-        
-        # Generate data points throughout the day
-        for hour in range(24):
-            for minute in range(60):
-                for second in range(0, 60, interval_seconds):
-                    timestamp = current_date + datetime.timedelta(hours=hour, minutes=minute, seconds=second)
-                    
-                    # Base activity level from hourly pattern
-                    if day < 5:  # Weekday pattern
-                        if hour < 6:  # Sleep
-                            base_activity = max(5, np.random.normal(10, 5))
-                        elif 6 <= hour < 9:  # Morning activity peak
-                            base_activity = max(10, np.random.normal(70, 15))
-                        elif 9 <= hour < 12:  # Work morning
-                            base_activity = max(10, np.random.normal(40, 10))
-                        elif 12 <= hour < 14:  # Lunch
-                            base_activity = max(10, np.random.normal(60, 15))
-                        elif 14 <= hour < 17:  # Work afternoon
-                            base_activity = max(10, np.random.normal(35, 10))
-                        elif 17 <= hour < 19:  # Evening commute/exercise
-                            base_activity = max(10, np.random.normal(65, 15))
-                        elif 19 <= hour < 22:  # Evening leisure
-                            base_activity = max(10, np.random.normal(30, 10))
-                        else:  # Wind down for sleep
-                            base_activity = max(5, np.random.normal(15, 5))
-                    else:  # Weekend pattern
-                        if hour < 8:  # Sleep longer
-                            base_activity = max(5, np.random.normal(10, 5))
-                        elif 8 <= hour < 11:  # Morning leisure
-                            base_activity = max(10, np.random.normal(40, 10))
-                        elif 11 <= hour < 15:  # Weekend activities
-                            base_activity = max(10, np.random.normal(75, 20))
-                        elif 15 <= hour < 19:  # Afternoon activities
-                            base_activity = max(10, np.random.normal(65, 15))
-                        elif 19 <= hour < 23:  # Evening leisure
-                            base_activity = max(10, np.random.normal(45, 15))
-                        else:  # Late night
-                            base_activity = max(5, np.random.normal(20, 10))
-                    
-                    # Add minute-level patterns
-                    minute_factor = 1.0
-                    
-                    # Beginning of hour tends to be more active
-                    if minute < 15:
-                        minute_factor = 1.1
-                    # Mid-hour dip
-                    elif 25 <= minute < 40:
-                        minute_factor = 0.9
-                    # End of hour increase
-                    elif minute >= 50:
-                        minute_factor = 1.05
-                    
-                    # Add short-term variations for 1-second data
-                    # This creates small fluctuations that make the 1-second 
-                    # resolution data more realistic and interesting to visualize
-                    short_term_factor = 1.0 + 0.05 * np.sin(second * 0.5) + 0.03 * np.cos(second * 0.3)
-                    
-                    # Calculate final activity
-                    activity = base_activity * minute_factor * short_term_factor
-                    
-                    # Ensure we get some red candles by occasionally decreasing activity
-                    if np.random.random() < 0.4:  # 40% chance of activity decrease
-                        activity = activity * np.random.uniform(0.7, 0.95)
-                    
-                    # Constrain between 0-100
-                    activity = max(0, min(100, activity))
-                    
-                    # Add to data list
-                    data.append({
-                        'timestamp': timestamp,
-                        'activity_level': activity
-                    })
-    
-    # Convert to DataFrame
-    df = pd.DataFrame(data)
-    
-    # Add day_of_week column
-    df['day_of_week'] = df['timestamp'].dt.day_name()
+    n_samples = days * 24 * 60 * 60
+    timestamps = pd.date_range(start_date, periods=n_samples, freq='s')
+    
+    # Base activity level from hourly pattern, looked up once per hour
+    floor, mean, std = (np.repeat(param.astype(np.float32), 3600)
+                        for param in _activity_params(np.arange(days * 24)))
+    activity = rng.standard_normal(n_samples, dtype=np.float32)
+    activity *= std
+    activity += mean
+    np.maximum(activity, floor, out=activity)
+    
+    # Add minute-level patterns and short-term variations for 1-second data;
+    # the combined factor repeats every hour, so apply it row-wise
+    hour_factor = np.repeat(MINUTE_FACTOR_LUT, 60) * np.tile(SHORT_TERM_LUT, 60)
+    activity.reshape(-1, 3600)[:] *= hour_factor
+    
+    # Ensure we get some red candles by occasionally decreasing activity
+    decrease = rng.random(n_samples, dtype=np.float32) < 0.4  # 40% chance of activity decrease
+    activity[decrease] *= rng.uniform(0.7, 0.95, np.count_nonzero(decrease)).astype(np.float32)
+    
+    # Constrain between 0-100
+    np.clip(activity, 0, 100, out=activity)
+    
+    df = pd.DataFrame({'timestamp': timestamps, 'activity_level': activity})
+    
+    # Add day_of_week column as a categorical; each day is one block of seconds
+    weekdays = (start_date.weekday() + np.arange(days)) % 7
+    df['day_of_week'] = pd.Categorical.from_codes(np.repeat(weekdays, 24 * 60 * 60),
+                                                  categories=DAYS_OF_WEEK, ordered=True)
     
     return df
 
@@ -1,26 +1,165 @@
 import pandas as pd
 import numpy as np
+import contextlib
 import datetime
+import io
+import multiprocessing
 import os
 
-def generate_1second_data(output_file="kineticandles_data.csv", days=1, start_day=0, time_range=None):
+# Simulated activity periods: (first hour, floor, mean, std) of the base activity level.
+# These mirror the app's tables in KinetiCandles_v3.py; they are copied rather than
+# imported so this script (and its worker processes) runs without Tk or matplotlib
+WEEKDAY_ACTIVITY_PERIODS = np.array([
+    (0, 5, 10, 5),     # Sleep
+    (6, 10, 70, 15),   # Morning activity peak
+    (9, 10, 40, 10),   # Work morning
+    (12, 10, 60, 15),  # Lunch
+    (14, 10, 35, 10),  # Work afternoon
+    (17, 10, 65, 15),  # Evening commute/exercise
+    (19, 10, 30, 10),  # Evening leisure
+    (22, 5, 15, 5),    # Wind down for sleep
+], dtype=float)
+WEEKEND_ACTIVITY_PERIODS = np.array([
+    (0, 5, 10, 5),     # Sleep longer
+    (8, 10, 40, 10),   # Morning leisure
+    (11, 10, 75, 20),  # Weekend activities
+    (15, 10, 65, 15),  # Afternoon activities
+    (19, 10, 45, 15),  # Evening leisure
+    (23, 5, 20, 10),   # Late night
+], dtype=float)
+# The periods expanded to (floor, mean, std) for each hour of the day, indexed by
+# [is_weekend, hour]
+_HOURS_OF_DAY = np.arange(24)
+HOURLY_ACTIVITY_PARAMS = np.stack([
+    periods[np.searchsorted(periods[:, 0], _HOURS_OF_DAY, side='right') - 1, 1:]
+    for periods in (WEEKDAY_ACTIVITY_PERIODS, WEEKEND_ACTIVITY_PERIODS)
+])
+
+# Within-hour pattern by minute: the beginning of the hour tends to be more active,
+# with a mid-hour dip and an increase towards the end of the hour
+_SIXTY = np.arange(60)
+MINUTE_FACTORS = np.select(
+    [_SIXTY < 15, (_SIXTY >= 25) & (_SIXTY < 40), _SIXTY >= 50], [1.1, 0.9, 1.05], default=1.0
+)
+# Small fluctuations by second, which make the 1-second resolution data
+# more realistic and interesting to visualize
+SECOND_FACTORS = 1.0 + 0.05 * np.sin(_SIXTY * 0.5) + 0.03 * np.cos(_SIXTY * 0.3)
+
+# Categories of the day_of_week column, in weekday code order
+DAYS_OF_WEEK = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+def _generate_day(current_date, start_hour, hours_per_day, rng):
+    """Generate one day's 1-second readings for the selected hours.
+    
+    Args:
+        current_date: Midnight of the day to generate
+        start_hour: First hour of the day to generate
+        hours_per_day: Number of hours to generate
+        rng: NumPy random Generator to draw from
+        
+    Returns:
+        DataFrame with timestamp, activity_level and day_of_week columns
+    """
+    day_of_week = current_date.weekday()  # 0=Monday, 6=Sunday
+    is_weekend = day_of_week >= 5
+    hourly_params = HOURLY_ACTIVITY_PARAMS[int(is_weekend)]
+    
+    # Generate every second of the day at once from its hour, minute and second
+    day_points = hours_per_day * 60 * 60
+    t = np.arange(day_points)
+    hours = start_hour + t // 3600
+    minutes = t // 60 % 60
+    seconds = t % 60
+    
+    # Base activity level from hourly pattern
+    floor, mean, std = hourly_params[hours].T
+    activity = np.maximum(floor, rng.normal(mean, std))
+    
+    # Add minute-level and second-level patterns
+    activity *= MINUTE_FACTORS[minutes] * SECOND_FACTORS[seconds]
+    
+    # Ensure we get some red candles by occasionally decreasing activity
+    decrease = rng.random(day_points) < 0.4  # 40% chance of activity decrease
+    activity[decrease] *= rng.uniform(0.7, 0.95, decrease.sum())
+    
+    # Timestamps are the window start plus the second offsets within it
+    window_start = np.datetime64(current_date + datetime.timedelta(hours=start_hour), 's')
+    
+    return pd.DataFrame({
+        'timestamp': window_start + t,
+        'activity_level': np.clip(activity, 0, 100).astype(np.float32),  # Constrain between 0-100
+        # Add day_of_week column as a categorical over the int weekday code
+        'day_of_week': pd.Categorical.from_codes(np.full(day_points, day_of_week), categories=DAYS_OF_WEEK)
+    })
+
+def _format_csv(chunk, header):
+    """Format one day's rows as CSV bytes.
+    
+    Uses pyarrow's C++ CSV writer when it is installed, which is several times
+    faster than DataFrame.to_csv, and falls back to to_csv otherwise.
+    
+    Args:
+        chunk: DataFrame of the day's rows
+        header: Whether to start with the header line
+        
+    Returns:
+        The CSV text as bytes
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        return chunk.to_csv(header=header, index=False, lineterminator='\n').encode()
+    
+    buffer = io.BytesIO()
+    if header:
+        # write_csv quotes its header, so the plain header is written here
+        buffer.write((','.join(chunk.columns) + '\n').encode())
+    pacsv.write_csv(pa.Table.from_pandas(chunk, preserve_index=False), buffer,
+                    pacsv.WriteOptions(include_header=False, quoting_style='none'))
+    return buffer.getvalue()
+
+def _generate_day_task(task):
+    """Generate one day in a worker process and return it ready to write.
+    
+    Args:
+        task: Tuple of (current_date, start_hour, hours_per_day, seed_sequence,
+              as_csv, header)
+        
+    Returns:
+        Tuple of (first timestamp, last timestamp, row count, payload), where the
+        payload is the day's CSV bytes when as_csv is set, otherwise its DataFrame
+    """
+    current_date, start_hour, hours_per_day, seed_sequence, as_csv, header = task
+    chunk = _generate_day(current_date, start_hour, hours_per_day, np.random.default_rng(seed_sequence))
+    # Formatting the CSV rows is most of a day's cost, so it is done here in
+    # the worker rather than in the process writing the file
+    payload = _format_csv(chunk, header) if as_csv else chunk
+    return chunk['timestamp'].iloc[0], chunk['timestamp'].iloc[-1], len(chunk), payload
+
+def generate_1second_data(output_file="kineticandles_data.csv", days=1, start_day=0, time_range=None,
+                          seed=None, processes=None):
     """Generate high-resolution accelerometer data with 1-second intervals.
     
+    Days are generated in parallel worker processes and appended to the file
+    in order as they complete, so memory use stays at a few days' data however
+    many days are written.
+    
     Args:
-        output_file: Path to save the CSV file
+        output_file: Path to save the data to; a .parquet extension writes a
+                     zstd-compressed Parquet file (needs pyarrow), anything else CSV
         days: Number of days to generate (default: 1)
         start_day: Starting day offset (0=Monday, 1=Tuesday, etc.)
         time_range: Optional tuple of (start_hour, end_hour) to limit data to specific hours
                    If None, generates full days
+        seed: Optional seed for reproducible data
+        processes: Number of worker processes (default: one per CPU); 1 generates
+                   every day in this process
     """
     print(f"Generating 1-second resolution data for {days} days...")
     
     # Create data with 1-second intervals
     start_date = datetime.datetime(2023, 5, 1 + start_day)  # May 1, 2023 was a Monday
-    interval_seconds = 1
-    
-    # Create empty dataframe
-    data = []
     
     # Process time range
     if time_range:
@@ -34,103 +173,55 @@ def generate_1second_data(output_file="kineticandles_data.csv", days=1, start_da
     total_points = days * hours_per_day * 60 * 60
     points_generated = 0
     
-    # Generate data points for each day
-    for day in range(days):
-        current_date = start_date + datetime.timedelta(days=day)
-        day_of_week = current_date.weekday()  # 0=Monday, 6=Sunday
-        is_weekend = day_of_week >= 5
-        
-        # Report progress
-        print(f"Generating data for {current_date.strftime('%A, %Y-%m-%d')}...")
-        
-        # Generate data points for the specified hours
-        for hour in range(start_hour, end_hour):
-            for minute in range(60):
-                for second in range(60):
-                    timestamp = current_date + datetime.timedelta(hours=hour, minutes=minute, seconds=second)
-                    
-                    # Base activity level from hourly pattern
-                    if not is_weekend:  # Weekday pattern
-                        if hour < 6:  # Sleep
-                            base_activity = max(5, np.random.normal(10, 5))
-                        elif 6 <= hour < 9:  # Morning activity peak
-                            base_activity = max(10, np.random.normal(70, 15))
-                        elif 9 <= hour < 12:  # Work morning
-                            base_activity = max(10, np.random.normal(40, 10))
-                        elif 12 <= hour < 14:  # Lunch
-                            base_activity = max(10, np.random.normal(60, 15))
-                        elif 14 <= hour < 17:  # Work afternoon
-                            base_activity = max(10, np.random.normal(35, 10))
-                        elif 17 <= hour < 19:  # Evening commute/exercise
-                            base_activity = max(10, np.random.normal(65, 15))
-                        elif 19 <= hour < 22:  # Evening leisure
-                            base_activity = max(10, np.random.normal(30, 10))
-                        else:  # Wind down for sleep
-                            base_activity = max(5, np.random.normal(15, 5))
-                    else:  # Weekend pattern
-                        if hour < 8:  # Sleep longer
-                            base_activity = max(5, np.random.normal(10, 5))
-                        elif 8 <= hour < 11:  # Morning leisure
-                            base_activity = max(10, np.random.normal(40, 10))
-                        elif 11 <= hour < 15:  # Weekend activities
-                            base_activity = max(10, np.random.normal(75, 20))
-                        elif 15 <= hour < 19:  # Afternoon activities
-                            base_activity = max(10, np.random.normal(65, 15))
-                        elif 19 <= hour < 23:  # Evening leisure
-                            base_activity = max(10, np.random.normal(45, 15))
-                        else:  # Late night
-                            base_activity = max(5, np.random.normal(20, 10))
-                    
-                    # Add minute-level patterns
-                    minute_factor = 1.0
-                    
-                    # Beginning of hour tends to be more active
-                    if minute < 15:
-                        minute_factor = 1.1
-                    # Mid-hour dip
-                    elif 25 <= minute < 40:
-                        minute_factor = 0.9
-                    # End of hour increase
-                    elif minute >= 50:
-                        minute_factor = 1.05
-                    
-                    # Add second-level patterns for 1-second data
-                    # This creates small fluctuations that make the 1-second 
-                    # resolution data more realistic and interesting to visualize
-                    short_term_factor = 1.0 + 0.05 * np.sin(second * 0.5) + 0.03 * np.cos(second * 0.3)
-                    
-                    # Calculate final activity
-                    activity = base_activity * minute_factor * short_term_factor
-                    
-                    # Ensure we get some red candles by occasionally decreasing activity
-                    if np.random.random() < 0.4:  # 40% chance of activity decrease
-                        activity = activity * np.random.uniform(0.7, 0.95)
-                    
-                    # Constrain between 0-100
-                    activity = max(0, min(100, activity))
-                    
-                    # Add to data list
-                    data.append({
-                        'timestamp': timestamp,
-                        'activity_level': activity
-                    })
-                    
-                    # Update progress counter
-                    points_generated += 1
-            
-            # Print progress every hour
-            progress = points_generated / total_points * 100
-            print(f"Progress: {progress:.1f}% ({points_generated}/{total_points} points)")
-    
-    # Convert to DataFrame
-    df = pd.DataFrame(data)
+    # Each day draws from its own PCG64 stream spawned from the seed, so the data
+    # is the same whichever process generates each day
+    day_seeds = np.random.SeedSequence(seed).spawn(days)
     
-    # Add day_of_week column
-    df['day_of_week'] = df['timestamp'].dt.day_name()
+    # Parquet stores binary typed columns, several times smaller than CSV text
+    # and much faster to load back
+    write_parquet = output_file.lower().endswith('.parquet')
+    if write_parquet:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
     
-    # Save to CSV
+    # Generate the days and stream them to the file in order: CSV rows with the
+    # header written once, or one Parquet row group per day
     print(f"Saving data to {output_file}...")
-    df.to_csv(output_file, index=False)
+    tasks = [
+        (start_date + datetime.timedelta(days=day), start_hour, hours_per_day, day_seed,
+         not write_parquet, day == 0)
+        for day, day_seed in enumerate(day_seeds)
+    ]
+    processes = min(processes or os.cpu_count() or 1, days)
+    first_timestamp = last_timestamp = None
+    parquet_writer = None
+    with open(output_file, 'wb') as f, \
+            (multiprocessing.Pool(processes) if processes > 1 else contextlib.nullcontext()) as pool:
+        # imap hands results back in day order while later days are still generating
+        results = pool.imap(_generate_day_task, tasks) if pool else map(_generate_day_task, tasks)
+        for task, (day_first, day_last, day_points, payload) in zip(tasks, results):
+            # Report progress
+            print(f"Generated data for {task[0].strftime('%A, %Y-%m-%d')}")
+            
+            if write_parquet:
+                table = pa.Table.from_pandas(payload, preserve_index=False)
+                if parquet_writer is None:
+                    parquet_writer = pq.ParquetWriter(f, table.schema, compression='zstd')
+                parquet_writer.write_table(table)
+            else:
+                f.write(payload)
+            
+            if first_timestamp is None:
+                first_timestamp = day_first
+            last_timestamp = day_last
+            points_generated += day_points
+            
+            # Print progress every day
+            progress = points_generated / total_points * 100
+            print(f"Progress: {progress:.1f}% ({points_generated}/{total_points} points)")
+        
+        if parquet_writer is not None:
+            parquet_writer.close()
     
     # Print file information
     file_size_kb = os.path.getsize(output_file) / 1024
@@ -142,8 +233,8 @@ def generate_1second_data(output_file="kineticandles_data.csv", days=1, start_da
     else:
         print(f"File size: {file_size_kb:.2f} KB")
         
-    print(f"Number of rows: {len(df)}")
-    print(f"Time range: {df['timestamp'].min()} to {df['timestamp'].max()}")
+    print(f"Number of rows: {points_generated}")
+    print(f"Time range: {first_timestamp} to {last_timestamp}")
     print(f"Ready to use with KinetiCandles!")
 
 # Example use cases